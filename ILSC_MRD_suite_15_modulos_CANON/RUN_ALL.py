@@ -131,6 +131,7 @@ def main():
     ap.add_argument('--summary', required=True)
     ap.add_argument('--timeout', type=int, default=180)
     ap.add_argument('--strict', action='store_true', help="Nonzero exit if any expectation fails")
+    ap.add_argument('--only', action='append', default=None, help="Restrict the run to this module (repeatable)")
     args=ap.parse_args()
 
     root=Path(args.root).resolve()
@@ -139,6 +140,8 @@ def main():
         raise SystemExit("Missing ILSC_jueces_checkers_v1 in suite root")
 
     mods=sorted([p for p in root.iterdir() if p.is_dir() and p.name.startswith('mrd_')])
+    if args.only:
+        mods=[m for m in mods if m.name in set(args.only)]
 
     out={}
     ok_all = True
@@ -106,7 +106,14 @@ def main(argv: Optional[List[str]] = None) -> int:
     ap.add_argument("--summary", required=True)
     ap.add_argument("--strict", action="store_true")
     ap.add_argument("--timeout", type=int, default=180)
+    ap.add_argument(
+        "--only",
+        action="append",
+        default=None,
+        help="Restrict the run to this module (repeatable)",
+    )
     ns = ap.parse_args(argv)
+    only = set(ns.only) if ns.only else None
 
     root = Path(ns.root).resolve()
     manifest = root / "manifest.yaml"
@@ -127,6 +134,8 @@ def main(argv: Optional[List[str]] = None) -> int:
         name = str(mod.get("name", "")).strip()
         if not name:
             continue
+        if only is not None and name not in only:
+            continue
         cases = mod.get("cases")
         if not isinstance(cases, list):
             continue
@@ -16,11 +16,6 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-try:
-    import yaml  # type: ignore[import-untyped]
-except ModuleNotFoundError:
-    from .util import simple_yaml as yaml
-
 from . import get_version
 from .catalog import build_catalog
 from .judges.nuclear_guard import claim_is_nuclear
@@ -29,9 +24,15 @@ from .lab import LabConfig, discover_claim_files, run_experiment_lab
 from .module_autogen import auto_generate_module, load_claim_file
 from .predictions.registry import find_registry_path, load_registry
 from .reporting import render_report_summary
-from .runner import extract_verdict_from_report, run_bundle, run_verify
+from .runner import (
+    extract_verdict_from_report,
+    run_bundle,
+    run_verify,
+    run_verify_parallel,
+)
 from .science_research import research_claim
 from .suites import SUITE_CANON, SUITE_EXTENSIONS, discover_suite_roots
+from .util.yaml_compat import safe_load as yaml_safe_load
 
 
 def _maybe_rich_print() -> Any:
@@ -86,6 +87,7 @@ def cmd_run(args: argparse.Namespace) -> int:
             strict=args.include_outputs,
             suite=args.suite,
             timeout=int(args.timeout) if args.timeout else None,
+            inproc=bool(args.inproc),
         )
     except RuntimeError as e:
         print(str(e), file=sys.stderr)
@@ -128,7 +130,15 @@ def cmd_verify(args: argparse.Namespace) -> int:
                 f"Suite '{suite_name}' not found. Expected folder: "
                 f"{SUITE_CANON if suite_name=='canon' else SUITE_EXTENSIONS}"
             )
-        code, summary = run_verify(root, strict=strict, timeout=int(args.timeout))
+        if args.sequential:
+            code, summary = run_verify(root, strict=strict, timeout=int(args.timeout))
+        else:
+            code, summary = run_verify_parallel(
+                root,
+                strict=strict,
+                timeout=int(args.timeout),
+                workers=int(args.jobs) if args.jobs else None,
+            )
         rc = max(rc, code)
         if summary:
             summaries.append(f"{suite_name}: {summary}")
@@ -301,7 +311,7 @@ def cmd_judge(args: argparse.Namespace) -> int:
             )
         )
 
-    claim = yaml.safe_load(claim_path.read_text(encoding="utf-8"))
+    claim = yaml_safe_load(claim_path.read_text(encoding="utf-8"))
     if not isinstance(claim, dict):
         raise SystemExit(
             _tr(
@@ -574,12 +584,31 @@ def build_parser() -> argparse.ArgumentParser:
     pr.add_argument("--out", help="Output directory. If provided, report is copied to out/report.json")
     pr.add_argument("--include-outputs", action="store_true", help="Also copy the module outputs folder into <out>/module_outputs (can be larger).")
     pr.add_argument("--timeout", type=int, default=180, help="Timeout for the run command in seconds (default: 180).")
+    pr.add_argument(
+        "--inproc",
+        action="store_true",
+        help=(
+            "Run the module runner inside this process "
+            "(faster startup; --timeout is not enforced)."
+        ),
+    )
     pr.set_defaults(func=cmd_run)
 
     pv = sub.add_parser("verify", help=_tr("Run a full MRD suite verification (canonical/extensions)", "Ejecuta verificación completa de suite MRD (canon/extensiones)"))
     pv.add_argument("--suite", default="canon", choices=["canon", "extensions", "all"], help="Which suite to verify (default: canon).")
     pv.add_argument("--strict", action="store_true", help="Fail if any expectation fails")
     pv.add_argument("--timeout", default=180, type=int, help="Timeout per MRD case (seconds).")
+    pv.add_argument(
+        "--jobs",
+        default=0,
+        type=int,
+        help="Modules verified concurrently (default: CPU count - 2).",
+    )
+    pv.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Run the suite runner once, one module after another.",
+    )
     pv.set_defaults(func=cmd_verify)
 
     pl = sub.add_parser("list", help=_tr("List available MRD modules", "Lista módulos MRD disponibles"))
@@ -15,8 +15,13 @@ from .catalog import build_catalog
 from .judges.nuclear_guard import claim_is_nuclear
 from .judges.pipeline import default_judges, run_pipeline
 from .science_research import research_claim
-from .suites import SUITE_EXTENSIONS, discover_suite_roots, find_repo_root
-from .util import simple_yaml
+from .suites import (
+    SUITE_EXTENSIONS,
+    clear_discovery_caches,
+    discover_suite_roots,
+    find_repo_root,
+)
+from .util.yaml_compat import safe_load as yaml_safe_load
 from .version import get_version
 
 try:
@@ -37,9 +42,7 @@ def _slugify(text: str) -> str:
 
 
 def _load_yaml_text(text: str) -> Any:
-    if _pyyaml is not None:
-        return _pyyaml.safe_load(text)
-    return simple_yaml.safe_load(text)
+    return yaml_safe_load(text)
 
 
 def _dump_yaml_text(data: Any) -> str:
@@ -121,6 +124,7 @@ def _extensions_root(start: Path) -> Path:
     manifest = ext / "manifest.yaml"
     if not manifest.is_file():
         manifest.write_text("version: 1\n\nmodules: []\n", encoding="utf-8")
+    clear_discovery_caches()
     return ext
 
 
@@ -564,6 +568,7 @@ def auto_generate_module(
     runner_name = f"run_{module_name}.py"
     runner_path = scripts / runner_name
     runner_path.write_text(_runner_script(module_name), encoding="utf-8")
+    clear_discovery_caches()
 
     if register_manifest:
         _update_manifest(ext_root, module_name=module_name, expect_prefix=_verdict_prefix(verdict))
@@ -9,6 +9,8 @@ from __future__ import annotations
 import re
 from typing import List
 
+_VERDICT_RE = re.compile(r"\b(PASS|FAIL|NO-EVAL)(?:\([^)]+\))?\b")
+
 
 def _contains_any(text: str, tokens: List[str]) -> bool:
     low = text.lower()
@@ -16,7 +18,7 @@ def _contains_any(text: str, tokens: List[str]) -> bool:
 
 
 def _extract_verdict(text: str) -> str:
-    match = re.search(r"\b(PASS|FAIL|NO-EVAL)(?:\([^)]+\))?\b", text.upper())
+    match = _VERDICT_RE.search(text.upper())
     if not match:
         return ""
     return match.group(0)
@@ -10,10 +10,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-try:
-    import yaml  # type: ignore[import-untyped]
-except ModuleNotFoundError:
-    from ..util import simple_yaml as yaml
+from ..util.yaml_compat import safe_load as yaml_safe_load
 
 
 @dataclass(frozen=True)
@@ -59,7 +56,7 @@ def _validate_registry_shape(obj: Any) -> None:
 
 
 def load_registry(path: Path) -> PredictionRegistry:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = yaml_safe_load(path.read_text(encoding="utf-8"))
     _validate_registry_shape(data)
 
     preds: List[Prediction] = []
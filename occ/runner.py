@@ -2,8 +2,10 @@
 
 The runtime is intentionally lightweight:
 
-- ``occ run`` executes a single module runner script based on a bundle YAML.
-- ``occ verify`` executes a suite runner script (canonical or extensions).
+- ``occ run`` executes a single module runner script based on a bundle YAML
+  (in a child interpreter, or in-process with ``inproc=True``).
+- ``occ verify`` executes a suite runner script (canonical or extensions),
+  fanning modules out to a worker pool and merging the per-module summaries.
 
 Suites:
 
@@ -13,15 +15,31 @@ Suites:
 
 from __future__ import annotations
 
+import contextlib
 import json
+import os
+import runpy
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from .suites import SUITE_CANON, SUITE_EXTENSIONS, discover_suite_roots
+from .suites import (
+    SUITE_CANON,
+    SUITE_EXTENSIONS,
+    build_suite_index,
+    discover_suite_roots,
+    find_module_runner,
+    infer_module_name,
+)
+from .util.json_compat import loads as json_loads
+from .util.yaml_compat import safe_load as yaml_safe_load
 
 
 @dataclass
@@ -39,81 +57,125 @@ def _suite_roots(start: Path) -> Tuple[Optional[Path], Optional[Path]]:
 
 
 def infer_module_from_yaml_path(yaml_path: Path) -> Optional[str]:
-    parts = [p.name for p in yaml_path.resolve().parents]
-    for name in parts:
-        if name.startswith("mrd_"):
-            return name
-    return None
+    return infer_module_name(yaml_path)
 
 
 def discover_module_runner(module_dir: Path) -> Optional[Path]:
-    scripts = module_dir / "scripts"
-    if not scripts.is_dir():
-        return None
-    # Prefer run_mrd_*.py
-    candidates = sorted(scripts.glob("run_mrd_*.py"))
-    if candidates:
-        return candidates[0]
-    # Fallback: any run_*.py
-    candidates = sorted(scripts.glob("run_*.py"))
-    return candidates[0] if candidates else None
+    return find_module_runner(module_dir)
 
 
-def newest_report(outputs_dir: Path) -> Optional[Path]:
-    if not outputs_dir.is_dir():
-        return None
-    reports = list(outputs_dir.glob("*.report.json"))
-    if not reports:
-        return None
-    reports.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return reports[0]
+def _scan_reports(outputs_dir: Path) -> Dict[str, int]:
+    """Map each ``*.report.json`` entry in ``outputs_dir`` to its mtime (ns).
 
+    Matches what ``outputs_dir.glob("*.report.json")`` returns: dot-prefixed
+    names and non-regular entries are included.
+    """
 
-def _report_snapshot(outputs_dir: Path) -> dict[Path, int]:
-    snap: dict[Path, int] = {}
-    if not outputs_dir.is_dir():
-        return snap
-    for p in outputs_dir.glob("*.report.json"):
-        try:
-            snap[p] = p.stat().st_mtime_ns
-        except OSError:
-            continue
-    return snap
+    found: Dict[str, int] = {}
+    try:
+        with os.scandir(outputs_dir) as it:
+            for e in it:
+                if not e.name.endswith(".report.json"):
+                    continue
+                try:
+                    found[e.path] = e.stat().st_mtime_ns
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return found
 
 
-def _newest_updated_report(outputs_dir: Path, before: dict[Path, int]) -> Optional[Path]:
-    changed: list[Path] = []
-    if not outputs_dir.is_dir():
+def newest_report(outputs_dir: Path) -> Optional[Path]:
+    reports = _scan_reports(outputs_dir)
+    if not reports:
         return None
-    for p in outputs_dir.glob("*.report.json"):
-        try:
-            now_ns = p.stat().st_mtime_ns
-        except OSError:
-            continue
-        prev = before.get(p)
-        if prev is None or now_ns > prev:
-            changed.append(p)
+    return Path(max(reports, key=reports.__getitem__))
+
+
+def _newest_updated_report(outputs_dir: Path, before: Dict[str, int]) -> Optional[Path]:
+    changed = {
+        p: now_ns for p, now_ns in _scan_reports(outputs_dir).items() if now_ns > before.get(p, -1)
+    }
     if not changed:
         return None
-    changed.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return changed[0]
+    return Path(max(changed, key=changed.__getitem__))
 
 
-def run_bundle(
-    bundle_yaml: Path,
-    module: Optional[str] = None,
-    out_dir: Optional[Path] = None,
-    strict: bool = False,
-    suite: str = "auto",  # auto|canon|extensions
-    timeout: Optional[int] = None,
-) -> RunResult:
-    bundle_yaml = bundle_yaml.resolve()
-    if not bundle_yaml.is_file():
-        raise FileNotFoundError(f"Bundle YAML not found: {bundle_yaml}")
+def _module_paths(mod: Any) -> List[str]:
+    paths = [getattr(mod, "__file__", None)]
+    paths += list(getattr(mod, "__path__", None) or [])
+    return [p for p in paths if isinstance(p, str)]
 
-    if module is None:
-        module = infer_module_from_yaml_path(bundle_yaml)
 
+def _imported_from(mod: Any, root: str) -> bool:
+    return any(os.path.realpath(p).startswith(root) for p in _module_paths(mod))
+
+
+@contextlib.contextmanager
+def _runner_process_state(runner: Path, bundle_yaml: Path, module_dir: Path) -> Iterator[None]:
+    """Emulate ``python <runner> <bundle>`` launched from ``module_dir``.
+
+    Runner scripts mutate ``sys.path`` and import per-module packages that
+    share names across modules (e.g. ``ilsc_mrd``), so cwd, ``sys.argv``,
+    ``sys.path`` and modules imported from ``module_dir`` are restored on
+    exit. Third-party and stdlib imports stay loaded: C extensions such as
+    numpy cannot be imported twice in one process. Not thread-safe: cwd and
+    ``sys.argv`` are global.
+    """
+
+    saved_argv = sys.argv[:]
+    saved_path = sys.path[:]
+    saved_modules = set(sys.modules)
+    saved_cwd = os.getcwd()
+    sys.argv = [str(runner), str(bundle_yaml)]
+    sys.path.insert(0, str(runner.parent))
+    os.chdir(module_dir)
+    try:
+        yield
+    finally:
+        os.chdir(saved_cwd)
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        root = os.path.join(os.path.realpath(module_dir), "")
+        for name in set(sys.modules) - saved_modules:
+            if _imported_from(sys.modules[name], root):
+                del sys.modules[name]
+
+
+# Runners read ``sys.argv``, resolve paths against the cwd and import packages
+# that share names across modules, so in-process runs are serialized. Callers
+# that want concurrency should use subprocess runs (see run_verify_parallel).
+_INPROC_LOCK = threading.Lock()
+
+
+def _run_runner_inproc(runner: Path, bundle_yaml: Path, module_dir: Path) -> int:
+    """Run a module runner in this interpreter and return its exit status.
+
+    Safe to call from several threads; runs are executed one at a time.
+    """
+
+    with _INPROC_LOCK, _runner_process_state(runner, bundle_yaml, module_dir):
+        try:
+            runpy.run_path(str(runner), run_name="__main__")
+        except SystemExit as e:
+            if e.code is None:
+                return 0
+            if isinstance(e.code, int):
+                return e.code
+            print(e.code, file=sys.stderr)
+            return 1
+        except Exception:
+            traceback.print_exc()
+            return 1
+    return 0
+
+
+def _locate_module(
+    bundle_yaml: Path,
+    module: Optional[str],
+    suite: str,
+) -> Tuple[str, Path, Optional[Path]]:
     canon_root, ext_root = _suite_roots(bundle_yaml.parent)
     if canon_root is None and ext_root is None:
         # allow running from repo root if cwd has suite
@@ -130,7 +192,7 @@ def run_bundle(
             "Could not infer module from YAML path. Provide --module mrd_xxx."
         )
 
-    module_dir: Optional[Path] = None
+    found: Optional[Path] = None
 
     def _try(root: Optional[Path]) -> Optional[Path]:
         if root is None:
@@ -139,41 +201,72 @@ def run_bundle(
         return cand if cand.is_dir() else None
 
     if suite == "canon":
-        module_dir = _try(canon_root)
+        found = _try(canon_root)
     elif suite == "extensions":
-        module_dir = _try(ext_root)
+        found = _try(ext_root)
     else:  # auto
-        module_dir = _try(canon_root) or _try(ext_root)
+        found = _try(canon_root) or _try(ext_root)
 
-    if module_dir is None:
+    if found is None:
         raise RuntimeError(
             f"Module not found: {module}. Looked in suites: canon/extensions."
         )
 
-    runner = discover_module_runner(module_dir)
+    return module, found, discover_module_runner(found)
+
+
+def run_bundle(
+    bundle_yaml: Path,
+    module: Optional[str] = None,
+    out_dir: Optional[Path] = None,
+    strict: bool = False,
+    suite: str = "auto",  # auto|canon|extensions
+    timeout: Optional[float] = None,
+    inproc: bool = False,
+) -> RunResult:
+    """Run ``bundle_yaml`` through its module runner.
+
+    With ``inproc=True`` the runner executes in this interpreter instead of a
+    child process, skipping interpreter startup; ``timeout`` is not enforced
+    on that path.
+    """
+
+    bundle_yaml = bundle_yaml.resolve()
+    if not bundle_yaml.is_file():
+        raise FileNotFoundError(f"Bundle YAML not found: {bundle_yaml}")
+
+    if module is None:
+        module = infer_module_from_yaml_path(bundle_yaml)
+
+    module, module_dir, runner = _locate_module(bundle_yaml, module, suite)
     if runner is None:
         raise RuntimeError(f"No runner script found in {module_dir/'scripts'}")
 
     # Ensure outputs exists
     outputs_dir = module_dir / "outputs"
     outputs_dir.mkdir(exist_ok=True)
-    before_reports = _report_snapshot(outputs_dir)
+    before_reports = _scan_reports(outputs_dir)
 
-    cmd = [sys.executable, str(runner), str(bundle_yaml)]
-    try:
-        proc = subprocess.run(
-            cmd,
-            cwd=str(module_dir),
-            timeout=(int(timeout) if timeout and int(timeout) > 0 else None),
-        )
-    except subprocess.TimeoutExpired as e:
-        raise RuntimeError(
-            f"Run timed out after {e.timeout}s for module {module} (input: {bundle_yaml})"
-        ) from e
+    if inproc:
+        returncode = _run_runner_inproc(runner, bundle_yaml, module_dir)
+    else:
+        cmd = [sys.executable, str(runner), str(bundle_yaml)]
+        try:
+            proc = subprocess.run(
+                cmd,
+                cwd=str(module_dir),
+                stdin=subprocess.DEVNULL,
+                timeout=(timeout if timeout and timeout > 0 else None),
+            )
+        except subprocess.TimeoutExpired as e:
+            raise RuntimeError(
+                f"Run timed out after {e.timeout}s for module {module} (input: {bundle_yaml})"
+            ) from e
+        returncode = proc.returncode
 
     # Prefer reports created/updated by this run, to avoid stale picks.
     report = _newest_updated_report(outputs_dir, before_reports)
-    if report is None and proc.returncode == 0:
+    if report is None and returncode == 0:
         report = newest_report(outputs_dir)
 
     if out_dir is not None:
@@ -194,28 +287,27 @@ def run_bundle(
         input_yaml=bundle_yaml,
         module_dir=module_dir,
         report_path=(out_dir / "report.json") if (out_dir and report) else report,
-        returncode=proc.returncode,
+        returncode=returncode,
     )
 
 
-def run_verify(
-    suite_root: Path,
-    strict: bool = False,
-    timeout: int = 180,
-) -> Tuple[int, Optional[Path]]:
-    suite_root = suite_root.resolve()
-    run_all = suite_root / "RUN_ALL.py"
-    run_all_ext = suite_root / "RUN_ALL_EXT.py"
-    if run_all.is_file():
-        runner = run_all
-    elif run_all_ext.is_file():
-        runner = run_all_ext
-    else:
-        raise RuntimeError(
-            f"No suite runner found at {suite_root} (expected RUN_ALL.py or RUN_ALL_EXT.py)"
-        )
+def _suite_runner(suite_root: Path) -> Path:
+    for name in ("RUN_ALL.py", "RUN_ALL_EXT.py"):
+        cand = suite_root / name
+        if cand.is_file():
+            return cand
+    raise RuntimeError(
+        f"No suite runner found at {suite_root} (expected RUN_ALL.py or RUN_ALL_EXT.py)"
+    )
 
-    summary = suite_root / "verification_summary.json"
+
+def _suite_runner_cmd(
+    runner: Path,
+    suite_root: Path,
+    summary: Path,
+    strict: bool,
+    timeout: int,
+) -> List[str]:
     cmd = [
         sys.executable,
         str(runner),
@@ -227,21 +319,167 @@ def run_verify(
     cmd += ["--timeout", str(int(timeout))]
     if strict:
         cmd.append("--strict")
+    return cmd
 
-    proc = subprocess.run(cmd, cwd=str(suite_root))
+
+def run_verify(
+    suite_root: Path,
+    strict: bool = False,
+    timeout: int = 180,
+) -> Tuple[int, Optional[Path]]:
+    """Run the suite runner once, visiting every module sequentially."""
+
+    suite_root = suite_root.resolve()
+    runner = _suite_runner(suite_root)
+
+    summary = suite_root / "verification_summary.json"
+    cmd = _suite_runner_cmd(runner, suite_root, summary, strict, timeout)
+
+    proc = subprocess.run(cmd, cwd=str(suite_root), stdin=subprocess.DEVNULL)
     return proc.returncode, (summary if summary.is_file() else None)
 
 
-def extract_verdict_from_report(report_path: Path) -> Optional[str]:
-    try:
-        data = json.loads(report_path.read_text(encoding="utf-8"))
-    except Exception:
+def default_verify_workers() -> int:
+    """Default pool size for :func:`run_verify_parallel` (leave two cores free)."""
+
+    return max(1, (os.cpu_count() or 1) - 2)
+
+
+def _suite_modules(suite_root: Path, runner: Path) -> List[str]:
+    """Return module names in the order the suite runner would visit them."""
+
+    if runner.name != "RUN_ALL_EXT.py":
+        return list(build_suite_index(suite_root).modules)
+
+    manifest = suite_root / "manifest.yaml"
+    if not manifest.is_file():
+        return []
+    mobj = yaml_safe_load(manifest.read_text(encoding="utf-8"))
+    modules = mobj.get("modules") if isinstance(mobj, dict) else None
+    names: List[str] = []
+    for mod in modules if isinstance(modules, list) else []:
+        if not isinstance(mod, dict):
+            continue
+        name = str(mod.get("name", "")).strip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def _verify_module(
+    runner: Path,
+    suite_root: Path,
+    module: str,
+    summary: Path,
+    strict: bool,
+    timeout: int,
+) -> Tuple[str, int, Any]:
+    cmd = _suite_runner_cmd(runner, suite_root, summary, strict, timeout)
+    cmd += ["--only", module]
+    proc = subprocess.run(cmd, cwd=str(suite_root), stdin=subprocess.DEVNULL)
+    part: Any = None
+    if summary.is_file():
+        try:
+            part = json_loads(summary.read_bytes())
+        except ValueError:
+            part = None
+    return module, proc.returncode, part
+
+
+def _merge_verify_summaries(
+    extensions: bool,
+    parts: List[Tuple[str, int, Any]],
+) -> Dict[str, Any]:
+    if extensions:
+        results: List[Any] = []
+        ok = True
+        for module, rc, part in parts:
+            if isinstance(part, dict) and isinstance(part.get("results"), list):
+                results.extend(part["results"])
+                ok = ok and bool(part.get("ok"))
+            else:
+                ok = False
+                results.append(
+                    {"module": module, "error": f"suite runner failed (rc={rc})", "match": False}
+                )
+        return {"suite": "extensions", "ok": ok, "results": results}
+
+    merged: Dict[str, Any] = {}
+    for module, rc, part in parts:
+        if isinstance(part, dict) and module in part:
+            merged[module] = part[module]
+        else:
+            merged[module] = {"error": f"suite runner failed (rc={rc})"}
+    return merged
+
+
+def run_verify_parallel(
+    suite_root: Path,
+    strict: bool = False,
+    timeout: int = 180,
+    workers: Optional[int] = None,
+) -> Tuple[int, Optional[Path]]:
+    """Verify a suite with one suite-runner process per module.
+
+    Modules are dispatched to a pool of ``workers`` threads (each one only
+    waits on its child process) and the per-module summaries are merged into
+    ``verification_summary.json`` using the same schema as :func:`run_verify`.
+    Falls back to :func:`run_verify` when the pool would hold a single worker.
+    """
+
+    suite_root = suite_root.resolve()
+    runner = _suite_runner(suite_root)
+    modules = _suite_modules(suite_root, runner)
+    if not modules:
+        # Nothing to fan out; let the suite runner report the problem itself.
+        return run_verify(suite_root, strict=strict, timeout=timeout)
+
+    pool_size = max(1, min(workers or default_verify_workers(), len(modules)))
+    if pool_size == 1:
+        # One worker would only add a suite-runner launch per module.
+        return run_verify(suite_root, strict=strict, timeout=timeout)
+
+    with tempfile.TemporaryDirectory(prefix="occ_verify_") as tmp:
+        with ThreadPoolExecutor(max_workers=pool_size) as pool:
+            futures = [
+                pool.submit(
+                    _verify_module,
+                    runner,
+                    suite_root,
+                    module,
+                    Path(tmp) / f"{module}.json",
+                    strict,
+                    timeout,
+                )
+                for module in modules
+            ]
+            parts = [f.result() for f in futures]
+
+    merged = _merge_verify_summaries(runner.name == "RUN_ALL_EXT.py", parts)
+    summary = suite_root / "verification_summary.json"
+    summary.write_text(json.dumps(merged, indent=2, ensure_ascii=False), encoding="utf-8")
+    return max(rc for _, rc, _ in parts), summary
+
+
+_VERDICT_KEYS = ("verdict", "VERDICT", "result")
+
+
+def _verdict_from_mapping(data: Any) -> Optional[str]:
+    if not isinstance(data, dict):
         return None
-    for key in ("verdict", "VERDICT", "result"):
+    for key in _VERDICT_KEYS:
         if key in data:
             return str(data[key])
     # Some reports may embed under 'summary'
-    if isinstance(data, dict) and "summary" in data and isinstance(data["summary"], dict):
+    if "summary" in data and isinstance(data["summary"], dict):
         if "verdict" in data["summary"]:
             return str(data["summary"]["verdict"])
     return None
+
+
+def extract_verdict_from_report(report_path: Path) -> Optional[str]:
+    try:
+        data = json_loads(report_path.read_bytes())
+    except Exception:
+        return None
+    return _verdict_from_mapping(data)
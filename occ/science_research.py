@@ -6,41 +6,57 @@ minimal environments.
 
 from __future__ import annotations
 
-import json
+import functools
+import io
 import re
 import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Mapping
+from typing import Any, Dict, List, Mapping, Tuple
 
+from .util.json_compat import loads as json_loads
 from .version import get_version
 
 USER_AGENT = f"occ-mrd-runner/{get_version('1.5.0')} (+https://github.com/MarcoAIsaac/OCC)"
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_+\-]{3,}")
+_MAX_KEYWORDS = 12
 
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _get_text(url: str, timeout_s: int) -> str:
+def _get_bytes(url: str, timeout_s: int) -> bytes:
     req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
     with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-        raw = resp.read()
-    if isinstance(raw, bytes):
-        return raw.decode("utf-8", errors="replace")
-    return str(raw)
+        return bytes(resp.read())
 
 
 def _get_json(url: str, timeout_s: int) -> Dict[str, Any]:
-    obj = json.loads(_get_text(url, timeout_s=timeout_s))
+    obj = json_loads(_get_bytes(url, timeout_s=timeout_s))
     if isinstance(obj, dict):
         return obj
     return {}
 
 
-def _tokens(text: str) -> List[str]:
-    return re.findall(r"[A-Za-z0-9_+\-]{3,}", text)
+@functools.lru_cache(maxsize=256)
+def _query_from_parts(raw_parts: Tuple[str, ...]) -> str:
+    # First spelling of each case-insensitive token, in order of appearance.
+    seen: Dict[str, str] = {}
+    for part in raw_parts:
+        for t in _TOKEN_RE.findall(part):
+            seen.setdefault(t.lower(), t)
+            if len(seen) >= _MAX_KEYWORDS:
+                break
+        if len(seen) >= _MAX_KEYWORDS:
+            break
+
+    if seen:
+        return " ".join(seen.values())
+    return "operational consistency falsifiable prediction"
 
 
 def build_query_from_claim(claim: Mapping[str, Any]) -> str:
@@ -74,52 +90,28 @@ def build_query_from_claim(claim: Mapping[str, Any]) -> str:
                 if isinstance(name, str):
                     raw_parts.append(name)
 
-    keywords: List[str] = []
-    seen: set[str] = set()
-    for part in raw_parts:
-        for t in _tokens(part):
-            low = t.lower()
-            if low in seen:
-                continue
-            seen.add(low)
-            keywords.append(t)
-            if len(keywords) >= 12:
-                break
-        if len(keywords) >= 12:
-            break
-
-    if keywords:
-        return " ".join(keywords)
-    return "operational consistency falsifiable prediction"
+    return _query_from_parts(tuple(raw_parts))
 
 
-def search_arxiv(query: str, max_results: int = 5, timeout_s: int = 15) -> List[Dict[str, Any]]:
-    params = urllib.parse.urlencode(
-        {
-            "search_query": f"all:{query}",
-            "start": 0,
-            "max_results": max_results,
-            "sortBy": "relevance",
-            "sortOrder": "descending",
-        }
-    )
-    url = f"https://export.arxiv.org/api/query?{params}"
-    xml_text = _get_text(url, timeout_s=timeout_s)
-
-    ns = {"atom": "http://www.w3.org/2005/Atom"}
-    root = ET.fromstring(xml_text)
+def _parse_arxiv_feed(raw: bytes) -> List[Dict[str, Any]]:
+    # Decode leniently (a stray bad byte must not sink the whole feed), then
+    # stream entries and drop each subtree once it has been extracted.
+    text = raw.decode("utf-8", errors="replace")
     out: List[Dict[str, Any]] = []
-    for entry in root.findall("atom:entry", ns):
-        title = " ".join((entry.findtext("atom:title", default="", namespaces=ns)).split())
-        summary = " ".join((entry.findtext("atom:summary", default="", namespaces=ns)).split())
-        link = entry.findtext("atom:id", default="", namespaces=ns)
-        published = entry.findtext("atom:published", default="", namespaces=ns)
+    for _, entry in ET.iterparse(io.StringIO(text), events=("end",)):
+        if entry.tag != f"{_ATOM}entry":
+            continue
+        title = " ".join(entry.findtext(f"{_ATOM}title", default="").split())
+        summary = " ".join(entry.findtext(f"{_ATOM}summary", default="").split())
+        link = entry.findtext(f"{_ATOM}id", default="")
+        published = entry.findtext(f"{_ATOM}published", default="")
 
         authors: List[str] = []
-        for author in entry.findall("atom:author", ns):
-            a = author.findtext("atom:name", default="", namespaces=ns).strip()
+        for author in entry.iterfind(f"{_ATOM}author"):
+            a = author.findtext(f"{_ATOM}name", default="").strip()
             if a:
                 authors.append(a)
+        entry.clear()
 
         out.append(
             {
@@ -134,6 +126,20 @@ def search_arxiv(query: str, max_results: int = 5, timeout_s: int = 15) -> List[
     return out
 
 
+def search_arxiv(query: str, max_results: int = 5, timeout_s: int = 15) -> List[Dict[str, Any]]:
+    params = urllib.parse.urlencode(
+        {
+            "search_query": f"all:{query}",
+            "start": 0,
+            "max_results": max_results,
+            "sortBy": "relevance",
+            "sortOrder": "descending",
+        }
+    )
+    url = f"https://export.arxiv.org/api/query?{params}"
+    return _parse_arxiv_feed(_get_bytes(url, timeout_s=timeout_s))
+
+
 def search_crossref(query: str, max_results: int = 5, timeout_s: int = 15) -> List[Dict[str, Any]]:
     params = urllib.parse.urlencode(
         {
@@ -210,22 +216,21 @@ def research_claim(
         "errors": [],
     }
 
-    try:
-        out["sources"]["arxiv"] = search_arxiv(
-            query,
-            max_results=max_results,
-            timeout_s=timeout_s,
-        )
-    except Exception as e:  # pragma: no cover - network dependent
-        out["errors"].append(f"arxiv: {e}")
-
-    try:
-        out["sources"]["crossref"] = search_crossref(
-            query,
-            max_results=max_results,
-            timeout_s=timeout_s,
-        )
-    except Exception as e:  # pragma: no cover - network dependent
-        out["errors"].append(f"crossref: {e}")
+    # Both endpoints are network-bound; query them concurrently so the wall time
+    # is bounded by the slower source instead of their sum.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = {
+            "arxiv": pool.submit(
+                search_arxiv, query, max_results=max_results, timeout_s=timeout_s
+            ),
+            "crossref": pool.submit(
+                search_crossref, query, max_results=max_results, timeout_s=timeout_s
+            ),
+        }
+        for name, future in futures.items():
+            try:
+                out["sources"][name] = future.result()
+            except Exception as e:  # pragma: no cover - network dependent
+                out["errors"].append(f"{name}: {e}")
 
     return out
@@ -6,17 +6,25 @@ The OCC repository can contain multiple suites:
 * Extensions suite (meta-MRDs / tooling): ``ILSC_MRD_suite_extensions``
 
 All discovery functions walk up the filesystem from a given start path.
+Found paths are memoized per absolute start path; misses are not, so a suite
+or runner created later is picked up on the next lookup. Memoized hits and
+suite indexes are snapshots: call :func:`clear_discovery_caches` after
+creating, renaming or removing modules on disk.
 """
 
 from __future__ import annotations
 
+import functools
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Callable, Dict, Generic, Hashable, Iterable, Optional, TypeVar
 
 SUITE_CANON = "ILSC_MRD_suite_15_modulos_CANON"
 SUITE_EXTENSIONS = "ILSC_MRD_suite_extensions"
 
+_T = TypeVar("_T")
+
 
 @dataclass(frozen=True)
 class SuiteRoots:
@@ -32,24 +40,67 @@ class SuiteRoots:
         return out
 
 
+@dataclass(frozen=True)
+class ModuleEntry:
+    name: str
+    module_dir: Path
+    runner_path: Optional[Path]
+    outputs_dir: Path
+
+
+@dataclass(frozen=True)
+class SuiteIndex:
+    """Modules of one suite root, keyed by folder name (``mrd_*``)."""
+
+    root: Path
+    modules: Dict[str, ModuleEntry]
+
+
+class _HitCache(Generic[_T]):
+    """Memoize non-``None`` results of ``fn``; ``None`` (not found) is recomputed."""
+
+    def __init__(self, fn: Callable[..., Optional[_T]], maxsize: int) -> None:
+        self._fn = fn
+        self._maxsize = maxsize
+        self._hits: Dict[Hashable, _T] = {}
+        functools.update_wrapper(self, fn)
+
+    def __call__(self, *args: Hashable) -> Optional[_T]:
+        try:
+            return self._hits[args]
+        except KeyError:
+            pass
+        result = self._fn(*args)
+        if result is not None:
+            if len(self._hits) >= self._maxsize:
+                self._hits.pop(next(iter(self._hits)), None)
+            self._hits[args] = result
+        return result
+
+    def cache_clear(self) -> None:
+        self._hits.clear()
+
+
+def _cache_hits(maxsize: int) -> Callable[[Callable[..., Optional[_T]]], _HitCache[_T]]:
+    return lambda fn: _HitCache(fn, maxsize)
+
+
 def _walk_up(start: Path) -> Iterable[Path]:
     p = start.resolve()
     yield p
     yield from p.parents
 
 
-def find_repo_root(start: Path) -> Optional[Path]:
-    """Return repo root (best effort) by looking for ``pyproject.toml``."""
-
+@_cache_hits(maxsize=512)
+def _find_repo_root_cached(start: Path) -> Optional[Path]:
     for parent in _walk_up(start):
         if (parent / "pyproject.toml").is_file():
             return parent
     return None
 
 
-def find_suite_root(start: Path, suite_dir_name: str) -> Optional[Path]:
-    """Find suite root directory by name, walking up from ``start``."""
-
+@_cache_hits(maxsize=512)
+def _find_suite_root_cached(start: Path, suite_dir_name: str) -> Optional[Path]:
     for parent in _walk_up(start):
         cand = parent / suite_dir_name
         if cand.is_dir():
@@ -57,6 +108,111 @@ def find_suite_root(start: Path, suite_dir_name: str) -> Optional[Path]:
     return None
 
 
+def find_repo_root(start: Path) -> Optional[Path]:
+    """Return repo root (best effort) by looking for ``pyproject.toml``."""
+
+    return _find_repo_root_cached(start.absolute())
+
+
+def find_suite_root(start: Path, suite_dir_name: str) -> Optional[Path]:
+    """Find suite root directory by name, walking up from ``start``."""
+
+    return _find_suite_root_cached(start.absolute(), suite_dir_name)
+
+
+def scan_runner_script(scripts: Path) -> Optional[Path]:
+    """Pick a module runner from ``scripts`` (``run_mrd_*.py``, else ``run_*.py``).
+
+    One directory scan sorts candidates into both buckets at once.
+    """
+
+    preferred: list[str] = []
+    fallback: list[str] = []
+    try:
+        with os.scandir(scripts) as it:
+            for e in it:
+                if not (e.name.startswith("run_") and e.name.endswith(".py")):
+                    continue
+                (preferred if e.name.startswith("run_mrd_") else fallback).append(e.name)
+    except OSError:
+        return None
+    names = preferred or fallback
+    return scripts / min(names) if names else None
+
+
+@_cache_hits(maxsize=512)
+def _find_module_runner_cached(module_dir: Path) -> Optional[Path]:
+    return scan_runner_script(module_dir / "scripts")
+
+
+def find_module_runner(module_dir: Path) -> Optional[Path]:
+    """Runner script of ``module_dir`` (see :func:`scan_runner_script`)."""
+
+    return _find_module_runner_cached(module_dir.absolute())
+
+
+@_cache_hits(maxsize=512)
+def _infer_module_name_cached(path: Path) -> Optional[str]:
+    # The literal path almost always names the module already; only pay for
+    # realpath() when it does not (symlinked layouts) or when ".." makes the
+    # literal parents unreliable.
+    if ".." not in path.parts:
+        for parent in path.parents:
+            if parent.name.startswith("mrd_"):
+                return parent.name
+    for parent in path.resolve().parents:
+        if parent.name.startswith("mrd_"):
+            return parent.name
+    return None
+
+
+def infer_module_name(path: Path) -> Optional[str]:
+    """Name of the closest ``mrd_*`` folder containing ``path``, if any."""
+
+    return _infer_module_name_cached(path.absolute())
+
+
+@functools.lru_cache(maxsize=64)
+def _build_suite_index_cached(suite_root: Path) -> SuiteIndex:
+    modules: Dict[str, ModuleEntry] = {}
+    with os.scandir(suite_root) as it:
+        children = sorted(
+            (e.name for e in it if e.name.startswith("mrd_") and e.is_dir()),
+        )
+    for name in children:
+        module_dir = suite_root / name
+        modules[name] = ModuleEntry(
+            name=name,
+            module_dir=module_dir,
+            runner_path=scan_runner_script(module_dir / "scripts"),
+            outputs_dir=module_dir / "outputs",
+        )
+    return SuiteIndex(root=suite_root, modules=modules)
+
+
+def build_suite_index(suite_root: Path) -> SuiteIndex:
+    """Index the modules of ``suite_root`` with one directory scan per level.
+
+    The index is a snapshot, kept until :func:`clear_discovery_caches`.
+    """
+
+    return _build_suite_index_cached(suite_root.absolute())
+
+
+def clear_discovery_caches() -> None:
+    """Forget memoized repo/suite roots, module runners, module names and indexes.
+
+    Needed whenever modules or suites are created, renamed or removed on disk
+    within a process that already ran discovery (e.g. module auto-generation).
+    """
+
+    _find_repo_root_cached.cache_clear()
+    _find_suite_root_cached.cache_clear()
+    _find_module_runner_cached.cache_clear()
+    _infer_module_name_cached.cache_clear()
+    _build_suite_index_cached.cache_clear()
+
+
 def discover_suite_roots(start: Path) -> SuiteRoots:
     """Discover canon/extensions suite roots starting from ``start``."""
 
@@ -0,0 +1,29 @@
+"""JSON decoding through ``orjson`` when it is installed.
+
+``orjson`` decodes bytes directly and is several times faster than the stdlib
+for large payloads (Crossref responses, module reports). It is stricter than
+:func:`json.loads` (no ``NaN``/``Infinity``, which some MRD reports contain),
+so anything it rejects is decoded again by the stdlib, which keeps the
+stdlib's behaviour and error messages.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson as _orjson
+except ModuleNotFoundError:
+    _orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document from ``bytes`` or ``str``."""
+
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
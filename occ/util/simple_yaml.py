@@ -15,41 +15,36 @@ It is **not** a full YAML implementation.
 from __future__ import annotations
 
 import ast
+import re
 from typing import Any, List, Tuple
 
-
-class _Line:
-    def __init__(self, indent: int, text: str) -> None:
-        self.indent = indent
-        self.text = text
+# Leading spaces (indent) and the rest of one line.
+_LINE_RE = re.compile(r"^( *)(.*)$", re.M)
+_CODE_PREFIX_RE = re.compile(r"""(?:[^'"#]+|'[^']*'?|"[^"]*"?)*""")
 
 
 def _strip_comment(raw: str) -> str:
-    in_single = False
-    in_double = False
-    out: List[str] = []
-    for ch in raw:
-        if ch == "'" and not in_double:
-            in_single = not in_single
-        elif ch == '"' and not in_single:
-            in_double = not in_double
-        elif ch == "#" and not in_single and not in_double:
-            break
-        out.append(ch)
-    return "".join(out).rstrip()
+    # Longest prefix without an unquoted "#"; quotes toggle as in YAML plain
+    # scalars (no escapes), and an unterminated quote runs to end of line.
+    return _CODE_PREFIX_RE.match(raw).group(0).rstrip()  # type: ignore[union-attr]
 
 
-def _tokenize(text: str) -> List[_Line]:
-    lines: List[_Line] = []
-    for raw in text.splitlines():
-        if not raw.strip() or raw.lstrip().startswith("#"):
-            continue
-        indent = len(raw) - len(raw.lstrip(" "))
-        cleaned = _strip_comment(raw[indent:])
-        if not cleaned:
+def _tokenize(text: str) -> Tuple[List[int], List[str]]:
+    """Split ``text`` into parallel ``indents``/``texts`` lists (one per line)."""
+
+    indents: List[int] = []
+    texts: List[str] = []
+    for m in _LINE_RE.finditer(text):
+        indent, body = m.groups()
+        body = body.rstrip()
+        if not body or body[0] == "#":
             continue
-        lines.append(_Line(indent, cleaned))
-    return lines
+        # Only lines containing "#" need the quote-aware comment scan.
+        cleaned = _strip_comment(body) if "#" in body else body
+        if cleaned:
+            indents.append(len(indent))
+            texts.append(cleaned)
+    return indents, texts
 
 
 def _parse_scalar(value: str) -> Any:
@@ -89,56 +84,59 @@ def _split_keyval(text: str) -> Tuple[str, str | None]:
     raise ValueError(f"Invalid YAML mapping entry: {text!r}")
 
 
-def _parse_block(lines: List[_Line], idx: int, indent: int) -> Tuple[Any, int]:
-    if idx >= len(lines):
+def _parse_block(
+    indents: List[int], texts: List[str], idx: int, indent: int
+) -> Tuple[Any, int]:
+    n = len(indents)
+    if idx >= n:
         return {}, idx
 
-    if lines[idx].indent < indent:
+    if indents[idx] < indent:
         return {}, idx
 
-    is_list = lines[idx].text.startswith("-") and lines[idx].indent == indent
+    is_list = texts[idx].startswith("-") and indents[idx] == indent
     out: Any = [] if is_list else {}
 
-    while idx < len(lines):
-        line = lines[idx]
-        if line.indent < indent:
+    while idx < n:
+        line_indent = indents[idx]
+        line_text = texts[idx]
+        if line_indent < indent:
             break
         if is_list:
-            if line.indent != indent or not line.text.startswith("-"):
+            if line_indent != indent or not line_text.startswith("-"):
                 break
-            payload = line.text[1:].strip()
+            payload = line_text[1:].strip()
             idx += 1
             if not payload:
-                value, idx = _parse_block(lines, idx, indent + 2)
+                value, idx = _parse_block(indents, texts, idx, indent + 2)
                 out.append(value)
                 continue
             if ":" in payload and not payload.startswith(('"', "'")):
                 key, val = _split_keyval(payload)
                 item: dict[str, Any] = {}
                 if val is None:
-                    nested, idx = _parse_block(lines, idx, indent + 2)
+                    nested, idx = _parse_block(indents, texts, idx, indent + 2)
                     item[key] = nested
                 elif val == ">-":
                     folded: List[str] = []
-                    while idx < len(lines) and lines[idx].indent > indent:
-                        folded.append(lines[idx].text.strip())
+                    while idx < n and indents[idx] > indent:
+                        folded.append(texts[idx].strip())
                         idx += 1
                     item[key] = " ".join(folded)
                 else:
                     item[key] = _parse_scalar(val)
-                while idx < len(lines) and lines[idx].indent >= indent + 2:
-                    nline = lines[idx]
-                    if nline.indent != indent + 2 or nline.text.startswith("-"):
+                while idx < n and indents[idx] >= indent + 2:
+                    if indents[idx] != indent + 2 or texts[idx].startswith("-"):
                         break
-                    nkey, nval = _split_keyval(nline.text)
+                    nkey, nval = _split_keyval(texts[idx])
                     idx += 1
                     if nval is None:
-                        nested, idx = _parse_block(lines, idx, indent + 4)
+                        nested, idx = _parse_block(indents, texts, idx, indent + 4)
                         item[nkey] = nested
                     elif nval == ">-":
                         folded = []
-                        while idx < len(lines) and lines[idx].indent > indent + 2:
-                            folded.append(lines[idx].text.strip())
+                        while idx < n and indents[idx] > indent + 2:
+                            folded.append(texts[idx].strip())
                             idx += 1
                         item[nkey] = " ".join(folded)
                     else:
@@ -147,17 +145,17 @@ def _parse_block(lines: List[_Line], idx: int, indent: int) -> Tuple[Any, int]:
             else:
                 out.append(_parse_scalar(payload))
         else:
-            if line.indent != indent:
+            if line_indent != indent:
                 break
-            key, val = _split_keyval(line.text)
+            key, val = _split_keyval(line_text)
             idx += 1
             if val is None:
-                nested, idx = _parse_block(lines, idx, indent + 2)
+                nested, idx = _parse_block(indents, texts, idx, indent + 2)
                 out[key] = nested
             elif val == ">-":
                 folded_root: List[str] = []
-                while idx < len(lines) and lines[idx].indent > indent:
-                    folded_root.append(lines[idx].text.strip())
+                while idx < n and indents[idx] > indent:
+                    folded_root.append(texts[idx].strip())
                     idx += 1
                 out[key] = " ".join(folded_root)
             else:
@@ -167,8 +165,8 @@ def _parse_block(lines: List[_Line], idx: int, indent: int) -> Tuple[Any, int]:
 
 
 def safe_load(text: str) -> Any:
-    lines = _tokenize(text)
-    if not lines:
+    indents, texts = _tokenize(text)
+    if not indents:
         return None
-    data, _ = _parse_block(lines, 0, lines[0].indent)
+    data, _ = _parse_block(indents, texts, 0, indents[0])
     return data
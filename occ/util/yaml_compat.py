@@ -0,0 +1,29 @@
+"""YAML loading through the fastest available backend.
+
+``yaml.safe_load`` always uses PyYAML's pure-Python ``SafeLoader``. When PyYAML
+was built against libyaml, ``CSafeLoader`` parses the same documents several
+times faster. Without PyYAML we fall back to :mod:`occ.util.simple_yaml`.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from . import simple_yaml
+
+try:
+    import yaml as _pyyaml  # type: ignore[import-untyped]
+except ModuleNotFoundError:
+    _pyyaml = None
+
+_LOADER: Any = None
+if _pyyaml is not None:
+    _LOADER = getattr(_pyyaml, "CSafeLoader", None) or _pyyaml.SafeLoader
+
+
+def safe_load(text: str) -> Any:
+    """Parse ``text`` like ``yaml.safe_load`` using the fastest loader available."""
+
+    if _pyyaml is None:
+        return simple_yaml.safe_load(text)
+    return _pyyaml.load(text, Loader=_LOADER)
@@ -8,16 +8,41 @@ We intentionally keep version lookup robust for:
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 import sys
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
+from typing import Any
+
+try:
+    import tomllib as _toml
+except ModuleNotFoundError:  # Python 3.10
+    try:
+        import tomli as _toml  # type: ignore[no-redef]
+    except ModuleNotFoundError:
+        _toml = None  # type: ignore[assignment]
 
 PACKAGE_NAME = "occ-mrd-runner"
+# Last resort when no TOML parser is importable (Python 3.10 without tomli).
 _VERSION_RE = re.compile(r'^\s*version\s*=\s*"([^"]+)"\s*$')
 
 
+def _pyproject_version(path: Path) -> str | None:
+    raw = path.read_bytes()
+    if _toml is not None:
+        data: Any = _toml.loads(raw.decode("utf-8"))
+        project = data.get("project") if isinstance(data, dict) else None
+        value = project.get("version") if isinstance(project, dict) else None
+        return str(value).strip() if value else None
+    for line in raw.decode("utf-8").splitlines():
+        match = _VERSION_RE.match(line)
+        if match:
+            return match.group(1).strip()
+    return None
+
+
 def _read_pyproject_version() -> str | None:
     meipass = getattr(sys, "_MEIPASS", "")
     candidates = [
@@ -28,24 +53,16 @@ def _read_pyproject_version() -> str | None:
         candidates.insert(0, Path(str(meipass)) / "pyproject.toml")
     for candidate in candidates:
         try:
-            if not candidate.is_file():
-                continue
-            for line in candidate.read_text(encoding="utf-8").splitlines():
-                match = _VERSION_RE.match(line)
-                if match:
-                    return match.group(1).strip()
+            found = _pyproject_version(candidate)
         except Exception:
             continue
+        if found:
+            return found
     return None
 
 
-def get_version(fallback: str = "") -> str:
-    """Return package version with practical fallbacks."""
-
-    env_version = str(os.getenv("OCC_APP_VERSION") or "").strip()
-    if env_version:
-        return env_version
-
+@functools.lru_cache(maxsize=1)
+def _resolved_version() -> str | None:
     pyproject_version = _read_pyproject_version()
     if pyproject_version:
         return pyproject_version
@@ -53,7 +70,29 @@ def get_version(fallback: str = "") -> str:
     try:
         return version(PACKAGE_NAME)
     except PackageNotFoundError:
-        pass
+        return None
+
+
+def invalidate_version_cache() -> None:
+    """Forget the version resolved from ``pyproject.toml``/package metadata."""
+
+    _resolved_version.cache_clear()
+
+
+def get_version(fallback: str = "") -> str:
+    """Return package version with practical fallbacks.
+
+    The environment override is read on every call; the file/metadata lookup
+    behind it is resolved once per process (see :func:`invalidate_version_cache`).
+    """
+
+    env_version = str(os.getenv("OCC_APP_VERSION") or "").strip()
+    if env_version:
+        return env_version
+
+    resolved = _resolved_version()
+    if resolved:
+        return resolved
 
     clean_fallback = fallback.strip()
     return clean_fallback if clean_fallback else "0.0.0"
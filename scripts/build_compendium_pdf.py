@@ -10,18 +10,30 @@ Editorial goals:
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import io
 import logging
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Iterable, List, Tuple
+from typing import TYPE_CHECKING, Any, List, Sequence, Tuple
 
 from pypdf import PdfReader, PdfWriter
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import cm
-from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from pypdf.errors import PdfReadError
+
+try:  # Optional: PyMuPDF's C parser extracts page text an order of magnitude faster.
+    import pymupdf
+except ModuleNotFoundError:  # pragma: no cover - pypdf fallback
+    pymupdf = None
+
+# ReportLab is only needed to render the patch PDFs; it is imported inside the
+# builders so the pypdf helpers (audit, page scans) load without it.
+if TYPE_CHECKING:
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import TableStyle
 
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_BASE = ROOT / "docs" / "OCC_Compendio_Canonico_Completo_FINAL_INTRO (1).pdf"
@@ -38,7 +50,14 @@ FRONT_ES = ROOT / "docs" / "canonical" / "OCC_FRONT_ES_v1.5.0.pdf"
 MARKER_EN = "NUCLEAR-INTEGRATED-SECTION-EN-V1.5.0"
 MARKER_ES = "NUCLEAR-INTEGRATED-SECTION-ES-V1.5.0"
 DEFAULT_INSERT_AFTER_PAGE = 82
+# Smallest page range worth handing to a text-extraction worker process.
+_MIN_PAGES_PER_WORKER = 50
 TOC_REPLACE_PAGE = 4
+# lang -> (front patch, nuclear section, TOC patch, marker, default output)
+LANG_TARGETS = {
+    "en": (FRONT_EN, SECTION_EN, TOC_EN, MARKER_EN, DEFAULT_OUT_EN),
+    "es": (FRONT_ES, SECTION_ES, TOC_ES, MARKER_ES, DEFAULT_OUT_ES),
+}
 
 logging.getLogger("pypdf").setLevel(logging.ERROR)
 
@@ -50,34 +69,78 @@ def _extract_text(page: object) -> str:
         return ""
 
 
-def _contains_marker(reader: PdfReader, marker: str) -> bool:
-    for page in reader.pages:
-        if marker in _extract_text(page):
-            return True
-    return False
+# Page classifiers, matched case-insensitively on the raw extracted text.
+_INSERT_PRIMARY_RE = re.compile(
+    r"4\. integración con el flujo|4\. integration with the flow", re.IGNORECASE
+)
+_J3_RE = re.compile(r"3\. j3", re.IGNORECASE)
+_RFS_RE = re.compile(r"rfs|recursos finitos", re.IGNORECASE)
+_SPANISH_PREDICTION_RE = re.compile(r"predicci[óo]n #", re.IGNORECASE)
+_ENGLISH_PREDICTION_RE = re.compile(r"\benglish\s+context:", re.IGNORECASE)
+
+
+def _extract_all_texts(reader: PdfReader) -> List[str]:
+    """Extract every page's text once; the page scans below share the result."""
+
+    return [_extract_text(page) for page in reader.pages]
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> List[str]:
+    """Worker: extract pages ``start``..``stop - 1`` with a process-local reader."""
+
+    reader = PdfReader(path)
+    return [_extract_text(reader.pages[idx]) for idx in range(start, stop)]
+
+
+def _extract_pdf_texts(path: Path, reader: PdfReader | None = None) -> List[str]:
+    """Extract every page's text of ``path``, using PyMuPDF when installed.
+
+    The pypdf fallback spreads large documents over worker processes, one
+    contiguous page range each.
+    """
+
+    if pymupdf is not None:
+        with pymupdf.open(path) as doc:
+            # No clipping: pypdf also returns text that overflows the page box.
+            return [page.get_text(clip=pymupdf.INFINITE_RECT()) for page in doc]
+
+    if reader is None:
+        reader = PdfReader(str(path))
+    total = len(reader.pages)
+    workers = min(os.cpu_count() or 1, total // _MIN_PAGES_PER_WORKER)
+    if workers < 2:
+        return _extract_all_texts(reader)
+    step = -(-total // workers)
+    starts = range(0, total, step)
+    stops = [min(start + step, total) for start in starts]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunks = pool.map(_extract_page_range, repeat(str(path)), starts, stops)
+        return [text for chunk in chunks for text in chunk]
+
+
+def _contains_marker(texts: Sequence[str], marker: str) -> bool:
+    return _find_marker_page(texts, marker) is not None
 
 
-def _find_marker_page(reader: PdfReader, marker: str) -> int | None:
-    for idx, page in enumerate(reader.pages, start=1):
-        if marker in _extract_text(page):
+def _find_marker_page(texts: Sequence[str], marker: str) -> int | None:
+    for idx, text in enumerate(texts, start=1):
+        if marker in text:
             return idx
     return None
 
 
-def _find_insert_after_page(reader: PdfReader) -> int:
+def _find_insert_after_page(texts: Sequence[str]) -> int:
     """Find where J4 should be inserted so it remains adjacent to J0..J3."""
 
-    for idx, page in enumerate(reader.pages, start=1):
-        text = _extract_text(page).lower()
-        if "4. integración con el flujo" in text or "4. integration with the flow" in text:
-            return idx
-
-    for idx, page in enumerate(reader.pages, start=1):
-        text = _extract_text(page).lower()
-        if "3. j3" in text and ("rfs" in text or "recursos finitos" in text):
+    # Prefer the "4. integration" page; otherwise fall back to the first J3/RFS page.
+    fallback: int | None = None
+    for idx, text in enumerate(texts, start=1):
+        if _INSERT_PRIMARY_RE.search(text):
             return idx
+        if fallback is None and _J3_RE.search(text) and _RFS_RE.search(text):
+            fallback = idx
 
-    return DEFAULT_INSERT_AFTER_PAGE
+    return fallback if fallback is not None else DEFAULT_INSERT_AFTER_PAGE
 
 
 def _resolve_base(path: Path) -> Path:
@@ -88,7 +151,22 @@ def _resolve_base(path: Path) -> Path:
     raise FileNotFoundError(f"Base compendium not found: {path}")
 
 
+def _open_base_reader(path: Path) -> PdfReader:
+    """Open the base compendium from memory.
+
+    pypdf seeks back and forth through the xref and object streams; one
+    sequential read avoids a storm of small reads on slow or network filesystems.
+    """
+
+    return PdfReader(io.BytesIO(path.read_bytes()), strict=False)
+
+
+@functools.lru_cache(maxsize=1)
 def _styles() -> dict[str, ParagraphStyle]:
+    """Paragraph styles shared by all patch builders (treat as read-only)."""
+
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
     base = getSampleStyleSheet()
     return {
         "title": ParagraphStyle(
@@ -158,372 +236,375 @@ def _styles() -> dict[str, ParagraphStyle]:
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _front_table_style() -> TableStyle:
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#e5eef9")),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.HexColor("#0f172a")),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, -1), 9.5),
+            ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#cbd5e1")),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 6),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+            ("TOPPADDING", (0, 0), (-1, -1), 4),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _toc_table_style() -> TableStyle:
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    label = _styles()["toc_label"]
+    return TableStyle(
+        [
+            ("FONTNAME", (0, 0), (-1, -1), label.fontName),
+            ("FONTSIZE", (0, 0), (-1, -1), label.fontSize),
+            ("LEADING", (0, 0), (-1, -1), label.leading),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 0),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+            ("TOPPADDING", (0, 0), (-1, -1), 1),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 1),
+            ("TEXTCOLOR", (0, 0), (-1, -1), colors.black),
+        ]
+    )
+
+
+# Story items are (kind, value) pairs: a _styles() key renders ``value`` as a
+# Paragraph; the special kinds below cover page breaks, preformatted mono
+# blocks and bold-coded lock lines.
+_BREAK = "break"
+_PRE = "pre"
+_LOCK = "lock"
+
+_FRONT_STORY: dict[str, Tuple[Tuple[str, Any], ...]] = {
+    "en": (
+        ("front_title", "Operational Consistency Compiler (OCC)"),
+        ("front_h2", "Canonical Compendium (English Edition) - v1.5.0"),
+        ("front_body", "Date: 2026-02-17<br/>Repository: github.com/MarcoAIsaac/OCC"),
+        (
+            "front_body",
+            "Scope: canonical theory framework, operational methodology, closed MRD modules, "
+            "and prediction catalog with reproducible traces.",
+        ),
+        (
+            "front_body",
+            "Editorial note: this English document is generated from the current canonical "
+            "source set and includes the integrated nuclear section J4/L4C*/L4E*.",
+        ),
+        (_BREAK, None),
+        ("front_h2", "Start Here"),
+        ("front_body", "Read the compendium in this order for fastest onboarding:"),
+        ("front_body", "1) Formal foundations (Document A+)"),
+        (
+            "front_body",
+            "2) Methodology and lock architecture (J0-J4 integrated in one judge sequence)",
+        ),
+        ("front_body", "3) MRD modules and reproducible PASS/FAIL/NO-EVAL workflows"),
+        ("front_body", "4) Prediction set and experimental-facing witness logic"),
+        (_BREAK, None),
+        ("front_h2", "Roadmap"),
+    ),
+    "es": (
+        ("front_title", "Operational Consistency Compiler (OCC)"),
+        ("front_h2", "Compendio Canonico (Edicion en Espanol) - v1.5.0"),
+        ("front_body", "Fecha: 2026-02-17<br/>Repositorio: github.com/MarcoAIsaac/OCC"),
+        (
+            "front_body",
+            "Alcance: marco teorico canonico, metodologia operacional, modulos MRD cerrados "
+            "y catalogo de predicciones con trazabilidad reproducible.",
+        ),
+        (
+            "front_body",
+            "Nota editorial: este documento en espanol se genera desde el conjunto canonico "
+            "actual e integra la seccion nuclear J4/L4C*/L4E* en el flujo principal.",
+        ),
+        (_BREAK, None),
+        ("front_h2", "Empieza Aqui"),
+        ("front_body", "Lee el compendio en este orden para acelerar el onboarding:"),
+        ("front_body", "1) Fundamentos formales (Documento A+)"),
+        (
+            "front_body",
+            "2) Metodologia y arquitectura de candados (J0-J4 integrados en una secuencia)",
+        ),
+        ("front_body", "3) Modulos MRD y flujos reproducibles PASS/FAIL/NO-EVAL"),
+        (
+            "front_body",
+            "4) Set de predicciones y logica de testigos para contrastacion experimental",
+        ),
+        (_BREAK, None),
+        ("front_h2", "Mapa del Compendio"),
+    ),
+}
+
+_FRONT_ROADMAP: dict[str, Tuple[Tuple[str, str], ...]] = {
+    "en": (
+        ("Section", "Purpose"),
+        ("Document A+", "Formal operational semantics and judge structure."),
+        ("Document A", "Methodological constraints and judge/lock contracts J0-J4."),
+        ("MRD modules", "Executable reproducibility and verdict artifacts."),
+        ("Predictions", "Operationally falsifiable outputs and witness mapping."),
+    ),
+    "es": (
+        ("Seccion", "Proposito"),
+        ("Documento A+", "Semantica operacional formal y estructura de jueces."),
+        ("Documento A", "Restricciones metodologicas y contratos de jueces/candados J0-J4."),
+        ("Modulos MRD", "Reproducibilidad ejecutable y artefactos de veredicto."),
+        ("Predicciones", "Salidas falsables operacionalmente y mapeo de testigos."),
+    ),
+}
+
+_SECTION_STORY: dict[str, Tuple[Tuple[str, Any], ...]] = {
+    "en": (
+        ("h1", "4. J4 — Nuclear Domain Guard (J4 / L4C* / L4E*)"),
+        (
+            "body",
+            "Concept (invariant): a nuclear claim is evaluable only if the nuclear domain "
+            "is explicitly declared and observationally anchored with reproducible provenance. "
+            "J4 is not an optional add-on; it is the domain continuation of J0-J3.",
+        ),
+        ("h1", "4.1 Why J4 is unavoidable"),
+        (
+            "body",
+            "Without domain declarations, nuclear claims become tuneable narratives: "
+            "the same statement can be made compatible with mutually incompatible channels "
+            "or detector regimes. J4 prevents this by forcing explicit energy windows, "
+            "isotopes, reaction channels, detector context, and evidence anchors.",
+        ),
+        ("h1", "4.2 Concept-to-equation bridge"),
+        (
+            "body",
+            "Invariant concept: evaluability in Ω_I and no hidden nuclear knob reinjection. "
+            "Data-dependent equations: threshold checks, residual checks, and anchor tests.",
+        ),
+        ("mono", "Eq. (1): 0 <= E_min < E_max  [MeV]"),
+        ("mono", "Eq. (2): z = |sigma_pred - sigma_obs| / sigma_obs_err"),
+        ("mono", "PASS(E) iff z <= z_max; FAIL(L4E5) iff z > z_max."),
+        ("h1", "4.3 L4C* locks (consistency/evaluability)"),
+        (_LOCK, ("L4C1", "Declare domain.energy_range_mev.{min_mev,max_mev}; missing -> NO-EVAL.")),
+        (_LOCK, ("L4C2", "Declare isotopes[] and reaction_channel; missing -> NO-EVAL.")),
+        (_LOCK, ("L4C3", "Declare detectors[] and operational resolution context.")),
+        (_LOCK, ("L4C4", "Units and thresholds must be explicit and internally consistent.")),
+        (_LOCK, ("L4C5", "Channel and isotope mapping must be non-ambiguous in Ω_I.")),
+        (_LOCK, ("L4C6", "No hidden control knob may carry claim support in Ω_I.")),
+        (_LOCK, ("L4C7", "Finite, reproducible computation path is mandatory for judgment.")),
+        (_BREAK, None),
+        ("h1", "4.4 L4E* locks (evidence/provenance)"),
+        (_LOCK, ("L4E1", "Evidence anchor must include dataset_ref.")),
+        (_LOCK, ("L4E2", "Provenance locator is required: source_url or dataset_doi.")),
+        (_LOCK, ("L4E3", "sigma_obs and sigma_obs_err must be declared with units.")),
+        (_LOCK, ("L4E4", "sigma_pred must reference the same observable definition.")),
+        (_LOCK, ("L4E5", "Residual z-test is mandatory; violation -> FAIL(L4E5).")),
+        (_LOCK, ("L4E6", "Evidence timestamp/version and run trace must be reproducible.")),
+        (_LOCK, ("L4E7", "If anchors are incomplete/untraceable -> NO-EVAL(L4E*).")),
+        ("h1", "4.5 Integration with J0-J3 flow"),
+        (
+            "body",
+            "Evaluation order remains J0 -> J1 -> J2 -> J3 -> J4. "
+            "J4 certifies domain-specific evaluability after projection, "
+            "identifiability, and finite-resource stability are already satisfied.",
+        ),
+        ("h1", "4.6 Runtime coupling (MRD and predictions)"),
+        (
+            "body",
+            "Runtime assets: occ/judges/nuclear_guard.py, "
+            "ILSC_MRD_suite_extensions/mrd_nuclear_guard/, "
+            "examples/claim_specs/nuclear_*.yaml, and predictions/registry.yaml (P-0004).",
+        ),
+        (
+            _PRE,
+            "CLI path:\n"
+            "occ judge examples/claim_specs/nuclear_pass.yaml --profile nuclear\n"
+            "occ verify --suite extensions --strict --timeout 60",
+        ),
+    ),
+    "es": (
+        ("h1", "4. J4 — Guardia de Dominio Nuclear (J4 / L4C* / L4E*)"),
+        (
+            "body",
+            "Concepto (invariante): un claim nuclear solo es evaluable si declara "
+            "explícitamente su dominio nuclear y lo ancla a evidencia trazable. "
+            "J4 no es un extra opcional; es la continuación de J0-J3 en dominio nuclear.",
+        ),
+        ("h1", "4.1 Por qué J4 es inevitable"),
+        (
+            "body",
+            "Sin declaraciones de dominio, un mismo claim puede ajustarse "
+            "artificialmente a canales o detectores incompatibles. J4 evita esa "
+            "maleabilidad exigiendo ventana energética, isotopos, canal de reacción, "
+            "contexto instrumental y anclaje observacional reproducible.",
+        ),
+        ("h1", "4.2 Puente concepto->ecuacion"),
+        (
+            "body",
+            "Concepto invariante: evaluabilidad en Ω_I sin reinyección de perillas "
+            "ocultas. Ecuaciones dependientes de datos: chequeos de umbral, "
+            "residuales y trazabilidad de anclajes.",
+        ),
+        ("mono", "Ec. (1): 0 <= E_min < E_max  [MeV]"),
+        ("mono", "Ec. (2): z = |sigma_pred - sigma_obs| / sigma_obs_err"),
+        ("mono", "PASS(E) si z <= z_max; FAIL(L4E5) si z > z_max."),
+        ("h1", "4.3 Familia L4C* (consistencia/evaluabilidad)"),
+        (
+            _LOCK,
+            ("L4C1", "Declarar domain.energy_range_mev.{min_mev,max_mev}; ausencia -> NO-EVAL."),
+        ),
+        (_LOCK, ("L4C2", "Declarar isotopes[] y reaction_channel; ausencia -> NO-EVAL.")),
+        (_LOCK, ("L4C3", "Declarar detectors[] y contexto de resolución operacional.")),
+        (_LOCK, ("L4C4", "Unidades y umbrales explícitos, coherentes y auditables.")),
+        (_LOCK, ("L4C5", "Mapeo no ambiguo entre canal/isótopos y observables en Ω_I.")),
+        (_LOCK, ("L4C6", "Prohibida perilla oculta que sostenga el claim en Ω_I.")),
+        (_LOCK, ("L4C7", "Ruta computacional finita y reproducible para emitir veredicto.")),
+        (_BREAK, None),
+        ("h1", "4.4 Familia L4E* (evidencia/procedencia)"),
+        (_LOCK, ("L4E1", "Anclaje obligatorio con evidence.dataset_ref.")),
+        (_LOCK, ("L4E2", "Localizador de procedencia obligatorio: source_url o dataset_doi.")),
+        (_LOCK, ("L4E3", "sigma_obs y sigma_obs_err declarados con unidades.")),
+        (_LOCK, ("L4E4", "sigma_pred debe referir exactamente el mismo observable.")),
+        (_LOCK, ("L4E5", "Test residual z obligatorio; violación -> FAIL(L4E5).")),
+        (_LOCK, ("L4E6", "Versionado temporal y traza de corrida reproducibles.")),
+        (_LOCK, ("L4E7", "Anclajes incompletos/no trazables -> NO-EVAL(L4E*).")),
+        ("h1", "4.5 Integración en el flujo J0-J3"),
+        (
+            "body",
+            "El orden de evaluación se mantiene: J0 -> J1 -> J2 -> J3 -> J4. "
+            "J4 certifica evaluabilidad nuclear específica después de cumplir "
+            "proyección, identificabilidad y estabilidad con recursos finitos.",
+        ),
+        ("h1", "4.6 Acoplamiento con MRD y predicciones"),
+        (
+            "body",
+            "Activos de runtime: occ/judges/nuclear_guard.py, "
+            "ILSC_MRD_suite_extensions/mrd_nuclear_guard/, "
+            "examples/claim_specs/nuclear_*.yaml y predictions/registry.yaml (P-0004).",
+        ),
+        (
+            _PRE,
+            "Ruta CLI:\n"
+            "occ judge examples/claim_specs/nuclear_pass.yaml --profile nuclear\n"
+            "occ verify --suite extensions --strict --timeout 60",
+        ),
+    ),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _source_digest() -> str:
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+def _patch_fingerprint(kind: str, *params: str) -> str:
+    """Keywords stamp of a patch PDF: this script's hash plus its build inputs."""
+
+    return ":".join(("occ-compendium-patch", _source_digest(), kind, *params))
+
+
+def _render_story(items: Sequence[Tuple[str, Any]]) -> List[Any]:
+    from reportlab.platypus import PageBreak, Paragraph, Preformatted
+
+    st = _styles()
+    story: List[Any] = []
+    for kind, value in items:
+        if kind == _BREAK:
+            story.append(PageBreak())
+        elif kind == _PRE:
+            story.append(Preformatted(value, st["mono"]))
+        elif kind == _LOCK:
+            code, text = value
+            story.append(Paragraph(f"<b>{code}</b>. {text}", st["body"]))
+        else:
+            story.append(Paragraph(value, st[kind]))
+    return story
+
+
 def build_front_patch(path: Path, lang: str) -> None:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import cm
+    from reportlab.platypus import SimpleDocTemplate, Table
+
     path.parent.mkdir(parents=True, exist_ok=True)
     doc = SimpleDocTemplate(
         str(path),
+        keywords=_patch_fingerprint("front", lang),
         pagesize=A4,
         topMargin=2.2 * cm,
         leftMargin=2.2 * cm,
         rightMargin=2.2 * cm,
         bottomMargin=2.0 * cm,
     )
-    st = _styles()
-    story = []
-
-    if lang == "en":
-        story.append(Paragraph("Operational Consistency Compiler (OCC)", st["front_title"]))
-        story.append(
-            Paragraph(
-                "Canonical Compendium (English Edition) - v1.5.0",
-                st["front_h2"],
-            )
-        )
-        story.append(
-            Paragraph(
-                "Date: 2026-02-17<br/>Repository: github.com/MarcoAIsaac/OCC",
-                st["front_body"],
-            )
-        )
-        story.append(
-            Paragraph(
-                "Scope: canonical theory framework, operational methodology, closed MRD modules, "
-                "and prediction catalog with reproducible traces.",
-                st["front_body"],
-            )
-        )
-        story.append(
-            Paragraph(
-                "Editorial note: this English document is generated from the current canonical "
-                "source set and includes the integrated nuclear section J4/L4C*/L4E*.",
-                st["front_body"],
-            )
-        )
-
-        story.append(PageBreak())
-        story.append(Paragraph("Start Here", st["front_h2"]))
-        story.append(
-            Paragraph(
-                "Read the compendium in this order for fastest onboarding:",
-                st["front_body"],
-            )
-        )
-        onboarding = [
-            "1) Formal foundations (Document A+)",
-            "2) Methodology and lock architecture (J0-J4 integrated in one judge sequence)",
-            "3) MRD modules and reproducible PASS/FAIL/NO-EVAL workflows",
-            "4) Prediction set and experimental-facing witness logic",
-        ]
-        for line in onboarding:
-            story.append(Paragraph(line, st["front_body"]))
-
-        story.append(PageBreak())
-        story.append(Paragraph("Roadmap", st["front_h2"]))
-        data = [
-            ["Section", "Purpose"],
-            ["Document A+", "Formal operational semantics and judge structure."],
-            ["Document A", "Methodological constraints and judge/lock contracts J0-J4."],
-            ["MRD modules", "Executable reproducibility and verdict artifacts."],
-            ["Predictions", "Operationally falsifiable outputs and witness mapping."],
-        ]
-    else:
-        story.append(Paragraph("Operational Consistency Compiler (OCC)", st["front_title"]))
-        story.append(
-            Paragraph(
-                "Compendio Canonico (Edicion en Espanol) - v1.5.0",
-                st["front_h2"],
-            )
-        )
-        story.append(
-            Paragraph(
-                "Fecha: 2026-02-17<br/>Repositorio: github.com/MarcoAIsaac/OCC",
-                st["front_body"],
-            )
-        )
-        story.append(
-            Paragraph(
-                "Alcance: marco teorico canonico, metodologia operacional, modulos MRD cerrados "
-                "y catalogo de predicciones con trazabilidad reproducible.",
-                st["front_body"],
-            )
-        )
-        story.append(
-            Paragraph(
-                "Nota editorial: este documento en espanol se genera desde el conjunto canonico "
-                "actual e integra la seccion nuclear J4/L4C*/L4E* en el flujo principal.",
-                st["front_body"],
-            )
-        )
-
-        story.append(PageBreak())
-        story.append(Paragraph("Empieza Aqui", st["front_h2"]))
-        story.append(
-            Paragraph(
-                "Lee el compendio en este orden para acelerar el onboarding:",
-                st["front_body"],
-            )
-        )
-        onboarding = [
-            "1) Fundamentos formales (Documento A+)",
-            "2) Metodologia y arquitectura de candados (J0-J4 integrados en una secuencia)",
-            "3) Modulos MRD y flujos reproducibles PASS/FAIL/NO-EVAL",
-            "4) Set de predicciones y logica de testigos para contrastacion experimental",
-        ]
-        for line in onboarding:
-            story.append(Paragraph(line, st["front_body"]))
-
-        story.append(PageBreak())
-        story.append(Paragraph("Mapa del Compendio", st["front_h2"]))
-        data = [
-            ["Seccion", "Proposito"],
-            ["Documento A+", "Semantica operacional formal y estructura de jueces."],
-            ["Documento A", "Restricciones metodologicas y contratos de jueces/candados J0-J4."],
-            ["Modulos MRD", "Reproducibilidad ejecutable y artefactos de veredicto."],
-            ["Predicciones", "Salidas falsables operacionalmente y mapeo de testigos."],
-        ]
-
+    key = "en" if lang == "en" else "es"
+    story = _render_story(_FRONT_STORY[key])
+    data = [list(row) for row in _FRONT_ROADMAP[key]]
     table = Table(data, colWidths=[5.2 * cm, 10.0 * cm], hAlign="LEFT")
-    table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#e5eef9")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.HexColor("#0f172a")),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 9.5),
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#cbd5e1")),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                ("TOPPADDING", (0, 0), (-1, -1), 4),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-            ]
-        )
-    )
+    table.setStyle(_front_table_style())
     story.append(table)
     doc.build(story)
 
 
 def build_integrated_nuclear_section(path: Path, lang: str, marker: str) -> None:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import cm
+    from reportlab.platypus import SimpleDocTemplate
+
     path.parent.mkdir(parents=True, exist_ok=True)
     doc = SimpleDocTemplate(
         str(path),
+        keywords=_patch_fingerprint("section", lang, marker),
         pagesize=A4,
         topMargin=2.0 * cm,
         leftMargin=2.0 * cm,
         rightMargin=2.0 * cm,
         bottomMargin=2.0 * cm,
     )
-    st = _styles()
-    story = []
+    doc.build(_render_story(_SECTION_STORY["en" if lang == "en" else "es"]))
 
-    if lang == "en":
-        story.append(Paragraph("4. J4 — Nuclear Domain Guard (J4 / L4C* / L4E*)", st["h1"]))
-        story.append(
-            Paragraph(
-                "Concept (invariant): a nuclear claim is evaluable only if the nuclear domain "
-                "is explicitly declared and observationally anchored with reproducible provenance. "
-                "J4 is not an optional add-on; it is the domain continuation of J0-J3.",
-                st["body"],
-            )
-        )
-        story.append(Paragraph("4.1 Why J4 is unavoidable", st["h1"]))
-        story.append(
-            Paragraph(
-                "Without domain declarations, nuclear claims become tuneable narratives: "
-                "the same statement can be made compatible with mutually incompatible channels "
-                "or detector regimes. J4 prevents this by forcing explicit energy windows, "
-                "isotopes, reaction channels, detector context, and evidence anchors.",
-                st["body"],
-            )
-        )
-        story.append(Paragraph("4.2 Concept-to-equation bridge", st["h1"]))
-        story.append(
-            Paragraph(
-                "Invariant concept: evaluability in Ω_I and no hidden nuclear knob reinjection. "
-                "Data-dependent equations: threshold checks, residual checks, and anchor tests.",
-                st["body"],
-            )
-        )
-        story.append(Paragraph("Eq. (1): 0 <= E_min < E_max  [MeV]", st["mono"]))
-        story.append(Paragraph("Eq. (2): z = |sigma_pred - sigma_obs| / sigma_obs_err", st["mono"]))
-        story.append(Paragraph("PASS(E) iff z <= z_max; FAIL(L4E5) iff z > z_max.", st["mono"]))
-        story.append(Paragraph("4.3 L4C* locks (consistency/evaluability)", st["h1"]))
-        l4c = [
-            ("L4C1", "Declare domain.energy_range_mev.{min_mev,max_mev}; missing -> NO-EVAL."),
-            ("L4C2", "Declare isotopes[] and reaction_channel; missing -> NO-EVAL."),
-            ("L4C3", "Declare detectors[] and operational resolution context."),
-            ("L4C4", "Units and thresholds must be explicit and internally consistent."),
-            ("L4C5", "Channel and isotope mapping must be non-ambiguous in Ω_I."),
-            ("L4C6", "No hidden control knob may carry claim support in Ω_I."),
-            ("L4C7", "Finite, reproducible computation path is mandatory for judgment."),
-        ]
-        for code, text in l4c:
-            story.append(Paragraph(f"<b>{code}</b>. {text}", st["body"]))
 
-        story.append(PageBreak())
-        story.append(Paragraph("4.4 L4E* locks (evidence/provenance)", st["h1"]))
-        l4e = [
-            ("L4E1", "Evidence anchor must include dataset_ref."),
-            ("L4E2", "Provenance locator is required: source_url or dataset_doi."),
-            ("L4E3", "sigma_obs and sigma_obs_err must be declared with units."),
-            ("L4E4", "sigma_pred must reference the same observable definition."),
-            ("L4E5", "Residual z-test is mandatory; violation -> FAIL(L4E5)."),
-            ("L4E6", "Evidence timestamp/version and run trace must be reproducible."),
-            ("L4E7", "If anchors are incomplete/untraceable -> NO-EVAL(L4E*)."),
-        ]
-        for code, text in l4e:
-            story.append(Paragraph(f"<b>{code}</b>. {text}", st["body"]))
-        story.append(Paragraph("4.5 Integration with J0-J3 flow", st["h1"]))
-        story.append(
-            Paragraph(
-                "Evaluation order remains J0 -> J1 -> J2 -> J3 -> J4. "
-                "J4 certifies domain-specific evaluability after projection, "
-                "identifiability, and finite-resource stability are already satisfied.",
-                st["body"],
-            )
-        )
-        story.append(Paragraph("4.6 Runtime coupling (MRD and predictions)", st["h1"]))
-        story.append(
-            Paragraph(
-                "Runtime assets: occ/judges/nuclear_guard.py, "
-                "ILSC_MRD_suite_extensions/mrd_nuclear_guard/, "
-                "examples/claim_specs/nuclear_*.yaml, and predictions/registry.yaml (P-0004).",
-                st["body"],
-            )
-        )
-        story.append(
-            Paragraph(
-                "CLI path:<br/>"
-                "occ judge examples/claim_specs/nuclear_pass.yaml --profile nuclear<br/>"
-                "occ verify --suite extensions --strict --timeout 60",
-                st["mono"],
-            )
-        )
-    else:
-        story.append(Paragraph("4. J4 — Guardia de Dominio Nuclear (J4 / L4C* / L4E*)", st["h1"]))
-        story.append(
-            Paragraph(
-                "Concepto (invariante): un claim nuclear solo es evaluable si declara "
-                "explícitamente su dominio nuclear y lo ancla a evidencia trazable. "
-                "J4 no es un extra opcional; es la continuación de J0-J3 en dominio nuclear.",
-                st["body"],
-            )
-        )
-        story.append(Paragraph("4.1 Por qué J4 es inevitable", st["h1"]))
-        story.append(
-            Paragraph(
-                "Sin declaraciones de dominio, un mismo claim puede ajustarse "
-                "artificialmente a canales o detectores incompatibles. J4 evita esa "
-                "maleabilidad exigiendo ventana energética, isotopos, canal de reacción, "
-                "contexto instrumental y anclaje observacional reproducible.",
-                st["body"],
-            )
-        )
-        story.append(Paragraph("4.2 Puente concepto->ecuacion", st["h1"]))
-        story.append(
-            Paragraph(
-                "Concepto invariante: evaluabilidad en Ω_I sin reinyección de perillas "
-                "ocultas. Ecuaciones dependientes de datos: chequeos de umbral, "
-                "residuales y trazabilidad de anclajes.",
-                st["body"],
-            )
-        )
-        story.append(Paragraph("Ec. (1): 0 <= E_min < E_max  [MeV]", st["mono"]))
-        story.append(Paragraph("Ec. (2): z = |sigma_pred - sigma_obs| / sigma_obs_err", st["mono"]))
-        story.append(Paragraph("PASS(E) si z <= z_max; FAIL(L4E5) si z > z_max.", st["mono"]))
-        story.append(Paragraph("4.3 Familia L4C* (consistencia/evaluabilidad)", st["h1"]))
-        l4c = [
-            ("L4C1", "Declarar domain.energy_range_mev.{min_mev,max_mev}; ausencia -> NO-EVAL."),
-            ("L4C2", "Declarar isotopes[] y reaction_channel; ausencia -> NO-EVAL."),
-            ("L4C3", "Declarar detectors[] y contexto de resolución operacional."),
-            ("L4C4", "Unidades y umbrales explícitos, coherentes y auditables."),
-            ("L4C5", "Mapeo no ambiguo entre canal/isótopos y observables en Ω_I."),
-            ("L4C6", "Prohibida perilla oculta que sostenga el claim en Ω_I."),
-            ("L4C7", "Ruta computacional finita y reproducible para emitir veredicto."),
-        ]
-        for code, text in l4c:
-            story.append(Paragraph(f"<b>{code}</b>. {text}", st["body"]))
+# Page numbers of the prediction chapter in the base compendium.
+_PREDICTION_PAGES = {"section": 331, "p1": 331, "p2": 332, "p3": 333, "p4": 334, "p5": 335}
 
-        story.append(PageBreak())
-        story.append(Paragraph("4.4 Familia L4E* (evidencia/procedencia)", st["h1"]))
-        l4e = [
-            ("L4E1", "Anclaje obligatorio con evidence.dataset_ref."),
-            ("L4E2", "Localizador de procedencia obligatorio: source_url o dataset_doi."),
-            ("L4E3", "sigma_obs y sigma_obs_err declarados con unidades."),
-            ("L4E4", "sigma_pred debe referir exactamente el mismo observable."),
-            ("L4E5", "Test residual z obligatorio; violación -> FAIL(L4E5)."),
-            ("L4E6", "Versionado temporal y traza de corrida reproducibles."),
-            ("L4E7", "Anclajes incompletos/no trazables -> NO-EVAL(L4E*)."),
-        ]
-        for code, text in l4e:
-            story.append(Paragraph(f"<b>{code}</b>. {text}", st["body"]))
-        story.append(Paragraph("4.5 Integración en el flujo J0-J3", st["h1"]))
-        story.append(
-            Paragraph(
-                "El orden de evaluación se mantiene: J0 -> J1 -> J2 -> J3 -> J4. "
-                "J4 certifica evaluabilidad nuclear específica después de cumplir "
-                "proyección, identificabilidad y estabilidad con recursos finitos.",
-                st["body"],
-            )
-        )
-        story.append(Paragraph("4.6 Acoplamiento con MRD y predicciones", st["h1"]))
-        story.append(
-            Paragraph(
-                "Activos de runtime: occ/judges/nuclear_guard.py, "
-                "ILSC_MRD_suite_extensions/mrd_nuclear_guard/, "
-                "examples/claim_specs/nuclear_*.yaml y predictions/registry.yaml (P-0004).",
-                st["body"],
-            )
-        )
-        story.append(
-            Paragraph(
-                "Ruta CLI:<br/>"
-                "occ judge examples/claim_specs/nuclear_pass.yaml --profile nuclear<br/>"
-                "occ verify --suite extensions --strict --timeout 60",
-                st["mono"],
-            )
-        )
-    doc.build(story)
-
-
-def _toc_entries(lang: str) -> List[Tuple[str, int]]:
-    prediction_pages = {"section": 331, "p1": 331, "p2": 332, "p3": 333, "p4": 334, "p5": 335}
-
-    if lang == "en":
-        return [
-            ("Scope", 1),
-            ("Start Here", 2),
-            ("Roadmap", 3),
-            ("Document A+ - Formal Defense (OCC)", 5),
-            ("Addendum - Real-Judge Upgrade", 48),
-            ("Document A - Methodology (J0-J4 judges and locks)", 53),
-            ("Closed modules (MRD)", 85),
-            ("Module - Observability and instrumentation (ISAAC)", 85),
-            ("Module - UV projection -> Omega_I (auditable)", 101),
-            ("Module 4F - Operational dictionary (CUI/HUI)", 119),
-            ("Module - Schwinger-Keldysh (open systems)", 137),
-            ("Module - Effective branch, decoherence, objectivity", 152),
-            ("Module - Symmetries, anomalies, topology (operational)", 169),
-            ("Module - EFT: operational renormalization", 187),
-            ("Module G0 - Effective dark matter", 204),
-            ("Module - Vacuum and effective dark energy", 219),
-            ("Module - IR gravity: PPN and gravitational waves", 234),
-            ("Module - Operational cosmology: local-cosmo bridge", 249),
-            ("Module 4F - Operational unification (gating)", 268),
-            ("Module 4F - Dynamic unification (multi-front consistency)", 283),
-            ("Module - Amplitudes: analyticity, unitarity, positivity", 299),
-            ("Module - Baryogenesis: EDM-GW correlation", 316),
-            ("Predictions", prediction_pages["section"]),
-            ("Prediction 1 - aQGC (VBS): positivity (one-operator)", prediction_pages["p1"]),
-            ("Prediction 2 - Cosmology: OCC prior + local-cosmo bridge", prediction_pages["p2"]),
-            ("Prediction 3 - Baryogenesis: EDM-GW correlation", prediction_pages["p3"]),
-            ("Prediction 4 - IR gravity: PPN + gravitational waves", prediction_pages["p4"]),
-            (
-                "Prediction 5 - Dynamic 4F unification: multi-front consistency",
-                prediction_pages["p5"],
-            ),
-        ]
-    return [
+_TOC_ENTRIES: dict[str, Tuple[Tuple[str, int], ...]] = {
+    "en": (
+        ("Scope", 1),
+        ("Start Here", 2),
+        ("Roadmap", 3),
+        ("Document A+ - Formal Defense (OCC)", 5),
+        ("Addendum - Real-Judge Upgrade", 48),
+        ("Document A - Methodology (J0-J4 judges and locks)", 53),
+        ("Closed modules (MRD)", 85),
+        ("Module - Observability and instrumentation (ISAAC)", 85),
+        ("Module - UV projection -> Omega_I (auditable)", 101),
+        ("Module 4F - Operational dictionary (CUI/HUI)", 119),
+        ("Module - Schwinger-Keldysh (open systems)", 137),
+        ("Module - Effective branch, decoherence, objectivity", 152),
+        ("Module - Symmetries, anomalies, topology (operational)", 169),
+        ("Module - EFT: operational renormalization", 187),
+        ("Module G0 - Effective dark matter", 204),
+        ("Module - Vacuum and effective dark energy", 219),
+        ("Module - IR gravity: PPN and gravitational waves", 234),
+        ("Module - Operational cosmology: local-cosmo bridge", 249),
+        ("Module 4F - Operational unification (gating)", 268),
+        ("Module 4F - Dynamic unification (multi-front consistency)", 283),
+        ("Module - Amplitudes: analyticity, unitarity, positivity", 299),
+        ("Module - Baryogenesis: EDM-GW correlation", 316),
+        ("Predictions", _PREDICTION_PAGES["section"]),
+        ("Prediction 1 - aQGC (VBS): positivity (one-operator)", _PREDICTION_PAGES["p1"]),
+        ("Prediction 2 - Cosmology: OCC prior + local-cosmo bridge", _PREDICTION_PAGES["p2"]),
+        ("Prediction 3 - Baryogenesis: EDM-GW correlation", _PREDICTION_PAGES["p3"]),
+        ("Prediction 4 - IR gravity: PPN + gravitational waves", _PREDICTION_PAGES["p4"]),
+        (
+            "Prediction 5 - Dynamic 4F unification: multi-front consistency",
+            _PREDICTION_PAGES["p5"],
+        ),
+    ),
+    "es": (
         ("Alcance", 1),
         ("Empieza aqui", 2),
         ("Mapa del compendio", 3),
@@ -546,22 +627,28 @@ def _toc_entries(lang: str) -> List[Tuple[str, int]]:
         ("Modulo 4F - Unificacion dinamica (consistencia multifrente)", 283),
         ("Modulo - Amplitudes: analiticidad, unitariedad, positividad", 299),
         ("Modulo - Bariogenesis: correlacion EDM-GW", 316),
-        ("Predicciones", prediction_pages["section"]),
-        ("Prediccion 1 - aQGC (VBS): positividad (one-operator)", prediction_pages["p1"]),
-        ("Prediccion 2 - Cosmologia: prior OCC + puente local-cosmo", prediction_pages["p2"]),
-        ("Prediccion 3 - Bariogenesis: correlacion EDM-GW", prediction_pages["p3"]),
-        ("Prediccion 4 - Gravedad IR: PPN + ondas gravitacionales", prediction_pages["p4"]),
+        ("Predicciones", _PREDICTION_PAGES["section"]),
+        ("Prediccion 1 - aQGC (VBS): positividad (one-operator)", _PREDICTION_PAGES["p1"]),
+        ("Prediccion 2 - Cosmologia: prior OCC + puente local-cosmo", _PREDICTION_PAGES["p2"]),
+        ("Prediccion 3 - Bariogenesis: correlacion EDM-GW", _PREDICTION_PAGES["p3"]),
+        ("Prediccion 4 - Gravedad IR: PPN + ondas gravitacionales", _PREDICTION_PAGES["p4"]),
         (
             "Prediccion 5 - Unificacion dinamica 4F: consistencia multifrente",
-            prediction_pages["p5"],
+            _PREDICTION_PAGES["p5"],
         ),
-    ]
+    ),
+}
 
 
 def build_toc_patch(path: Path, lang: str) -> None:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import cm
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table
+
     path.parent.mkdir(parents=True, exist_ok=True)
     doc = SimpleDocTemplate(
         str(path),
+        keywords=_patch_fingerprint("toc", lang),
         pagesize=A4,
         topMargin=1.8 * cm,
         leftMargin=2.0 * cm,
@@ -578,24 +665,11 @@ def build_toc_patch(path: Path, lang: str) -> None:
         story.append(Paragraph("3  Indice", st["toc_label"]))
     story.append(Spacer(1, 0.2 * cm))
 
-    data: List[List[object]] = []
-    for label, page in _toc_entries(lang):
-        data.append([Paragraph(label, st["toc_label"]), Paragraph(str(page), st["toc_label"])])
+    # Labels carry no markup, so plain cells skip the Paragraph parser.
+    data = [[label, str(page)] for label, page in _TOC_ENTRIES["en" if lang == "en" else "es"]]
 
     table = Table(data, colWidths=[14.8 * cm, 1.5 * cm], hAlign="LEFT")
-    table.setStyle(
-        TableStyle(
-            [
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("ALIGN", (1, 0), (1, -1), "RIGHT"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                ("TOPPADDING", (0, 0), (-1, -1), 1),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 1),
-                ("TEXTCOLOR", (0, 0), (-1, -1), colors.black),
-            ]
-        )
-    )
+    table.setStyle(_toc_table_style())
     story.append(table)
     story.append(Spacer(1, 0.2 * cm))
     if lang == "en":
@@ -605,19 +679,6 @@ def build_toc_patch(path: Path, lang: str) -> None:
     doc.build(story)
 
 
-def _iter_with_insert(
-    pages: Iterable[object],
-    inserted_pages: List[object],
-    add_inserted: bool,
-    insert_after_page: int,
-) -> Iterable[Tuple[int, object, bool]]:
-    for idx, page in enumerate(pages, start=1):
-        yield idx, page, False
-        if add_inserted and idx == insert_after_page:
-            for inserted in inserted_pages:
-                yield idx, inserted, True
-
-
 def build_compendium(
     base_pdf: Path,
     front_pdf: Path,
@@ -627,7 +688,17 @@ def build_compendium(
     marker: str,
     lang: str,
     insert_after_page: int,
+    base_reader: PdfReader | None = None,
+    base_texts: Sequence[str] | None = None,
+    audit_lang: bool = False,
 ) -> dict[str, object]:
+    """Assemble one language edition.
+
+    Pass ``base_reader``/``base_texts`` to reuse an already parsed base PDF and
+    its extracted page text across editions. With ``audit_lang`` the result
+    carries a ``language_audit`` computed from the text already in memory.
+    """
+
     base_pdf = _resolve_base(base_pdf)
     if not front_pdf.is_file():
         raise FileNotFoundError(f"Front patch PDF not found: {front_pdf}")
@@ -636,34 +707,42 @@ def build_compendium(
     if not toc_pdf.is_file():
         raise FileNotFoundError(f"TOC patch PDF not found: {toc_pdf}")
 
-    base_reader = PdfReader(str(base_pdf))
+    if base_reader is None:
+        base_reader = _open_base_reader(base_pdf)
     front_reader = PdfReader(str(front_pdf))
     section_reader = PdfReader(str(section_pdf))
     toc_reader = PdfReader(str(toc_pdf))
     writer = PdfWriter()
 
-    marker_page = _find_marker_page(base_reader, marker)
+    if base_texts is None:
+        base_texts = _extract_pdf_texts(base_pdf, base_reader)
+
+    marker_page = _find_marker_page(base_texts, marker)
     already_integrated = marker_page is not None
+    base_pages = list(base_reader.pages)
+    front_pages = list(front_reader.pages)
+    toc_page = toc_reader.pages[0]
     inserted_pages = list(section_reader.pages)
     did_insert = False
 
-    for page_no, page, is_inserted in _iter_with_insert(
-        base_reader.pages,
-        inserted_pages,
-        not already_integrated,
-        insert_after_page,
-    ):
-        if is_inserted:
-            writer.add_page(page)
-            did_insert = True
-            continue
-
-        if page_no in (1, 2, 3):
-            writer.add_page(front_reader.pages[page_no - 1])
-        elif page_no == TOC_REPLACE_PAGE:
-            writer.add_page(toc_reader.pages[0])
-        else:
-            writer.add_page(page)
+    # Output plan: base pages with the front/TOC replacements, plus the section
+    # spliced in after ``insert_after_page`` (base numbering).
+    pages: List[object] = list(base_pages)
+    texts: List[str] = list(base_texts)
+    replacements = [*enumerate(front_pages[:3], start=1), (TOC_REPLACE_PAGE, toc_page)]
+    for page_no, page in replacements:
+        if page_no <= len(pages):
+            pages[page_no - 1] = page
+            texts[page_no - 1] = _extract_text(page)
+
+    if not already_integrated and 1 <= insert_after_page <= len(base_pages) and inserted_pages:
+        pages[insert_after_page:insert_after_page] = inserted_pages
+        texts[insert_after_page:insert_after_page] = [_extract_text(p) for p in inserted_pages]
+        did_insert = True
+
+    pages, texts, normalization = _normalize_prediction_language_pages(pages, texts, lang)
+    for page in pages:
+        writer.add_page(page)
 
     if base_reader.metadata:
         metadata = dict(base_reader.metadata)
@@ -677,26 +756,33 @@ def build_compendium(
     metadata["/Subject"] = "Integrated canonical compendium with J4/L4 nuclear section"
     metadata["/Creator"] = "OCC compendium builder (pypdf + reportlab)"
     writer.add_metadata(metadata)
+    # Merge byte-identical objects (fonts shared by the patch PDFs, repeated
+    # resources) and drop unreferenced ones; available in pypdf >= 5.
+    compress = getattr(writer, "compress_identical_objects", None)
+    if compress is not None:
+        compress()
 
     out_pdf.parent.mkdir(parents=True, exist_ok=True)
-    with NamedTemporaryFile("wb", delete=False, suffix=".pdf") as tmp:
-        writer.write(tmp)
-        tmp_path = Path(tmp.name)
-    out_pdf.write_bytes(tmp_path.read_bytes())
-    tmp_path.unlink(missing_ok=True)
-
-    normalization = _normalize_prediction_language_pages(out_pdf, lang)
-    out_reader = PdfReader(str(out_pdf))
+    # Stream into a sibling file and swap it in, so a failed write never
+    # leaves a truncated compendium behind.
+    tmp_path = out_pdf.with_name(out_pdf.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as fh:
+            writer.write(fh)
+        os.replace(tmp_path, out_pdf)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
     integrated_page = marker_page or (insert_after_page + 1)
-    return {
+    result: dict[str, object] = {
         "base": str(base_pdf),
         "front_patch": str(front_pdf),
         "section": str(section_pdf),
         "toc_patch": str(toc_pdf),
         "output": str(out_pdf),
-        "base_pages": len(base_reader.pages),
+        "base_pages": len(base_pages),
         "section_pages": len(section_reader.pages),
-        "output_pages": len(out_reader.pages),
+        "output_pages": len(pages),
         "already_integrated": already_integrated,
         "section_inserted": did_insert,
         "insert_after_page": insert_after_page,
@@ -705,181 +791,227 @@ def build_compendium(
         "lang": lang,
         "prediction_normalization": normalization,
     }
+    if audit_lang:
+        result["language_audit"] = _audit_texts(out_pdf, texts, lang)
+    return result
 
 
-def _prediction_candidate_pages(reader: PdfReader) -> List[int]:
-    pages: List[int] = []
-    for idx, page in enumerate(reader.pages, start=1):
-        text = _extract_text(page).lower()
-        if "predicción #" in text or "prediccion #" in text or _is_english_prediction_page(text):
-            pages.append(idx)
-    return pages
+def _prediction_page_lang(text: str) -> str | None:
+    """Classify a page as an ``"en"``/``"es"`` prediction page, or ``None``."""
 
+    if _ENGLISH_PREDICTION_RE.search(text):
+        return "en"
+    if _SPANISH_PREDICTION_RE.search(text):
+        return "es"
+    return None
 
-def _is_english_prediction_page(text: str) -> bool:
-    return re.search(r"\benglish\s+context:", text) is not None
 
+def _normalize_prediction_language_pages(
+    pages: List[object], texts: Sequence[str], lang: str
+) -> Tuple[List[object], List[str], dict[str, int]]:
+    """Keep only language-matching prediction pages instead of duplicating pairs.
 
-def _normalize_prediction_language_pages(out_pdf: Path, lang: str) -> dict[str, int]:
-    """Keep only language-matching prediction pages instead of duplicating pairs."""
+    Works on the assembled page list (and its extracted text) so the output is
+    written once.
+    """
 
-    reader = PdfReader(str(out_pdf))
-    total = len(reader.pages)
-    candidates = _prediction_candidate_pages(reader)
+    total = len(pages)
+    # Classify each page once; the span and the keep/drop pass both use it.
+    page_langs = [_prediction_page_lang(text) for text in texts]
+    candidates = [idx for idx, page_lang in enumerate(page_langs, start=1) if page_lang]
     if not candidates:
-        return {"removed_pages": 0, "total_before": total, "total_after": total}
+        return pages, list(texts), {"removed_pages": 0, "total_before": total, "total_after": total}
 
     span_start = min(candidates)
     span_end = max(candidates)
 
-    writer = PdfWriter()
+    kept: List[object] = []
+    kept_texts: List[str] = []
     removed_pages = 0
     kept_prediction_pages = 0
-    for idx in range(1, total + 1):
-        page = reader.pages[idx - 1]
-        if span_start <= idx <= span_end:
-            text = _extract_text(page).lower()
-            if (
-                "predicción #" in text
-                or "prediccion #" in text
-                or _is_english_prediction_page(text)
-            ):
-                if lang == "en":
-                    keep = _is_english_prediction_page(text)
-                else:
-                    keep = not _is_english_prediction_page(text)
-                if not keep:
-                    removed_pages += 1
-                    continue
-                kept_prediction_pages += 1
-        writer.add_page(page)
-
-    if reader.metadata:
-        writer.add_metadata(dict(reader.metadata))
-    with NamedTemporaryFile("wb", delete=False, suffix=".pdf") as tmp:
-        writer.write(tmp)
-        tmp_path = Path(tmp.name)
-    out_pdf.write_bytes(tmp_path.read_bytes())
-    tmp_path.unlink(missing_ok=True)
-
-    return {
+    want = "en" if lang == "en" else "es"
+    for page, text, page_lang in zip(pages, texts, page_langs):
+        # Every prediction page lies inside [span_start, span_end] by construction.
+        if page_lang is not None:
+            if page_lang != want:
+                removed_pages += 1
+                continue
+            kept_prediction_pages += 1
+        kept.append(page)
+        kept_texts.append(text)
+
+    stats = {
         "removed_pages": removed_pages,
         "total_before": total,
-        "total_after": len(writer.pages),
+        "total_after": len(kept),
         "prediction_span_start": span_start,
         "prediction_span_end": span_end,
         "kept_prediction_pages": kept_prediction_pages,
     }
+    return kept, kept_texts, stats
+
+
+# Opposite-language needles, matched case-insensitively on the raw page text.
+# "\A| " / " |\Z" stand in for the space-padded lowercase text used before.
+_AUDIT_NEEDLES_RE = {
+    "en": re.compile(
+        r"(?:\A| )español|(?:\A| )predicción|jueces|candados|metodología",
+        re.IGNORECASE,
+    ),
+    "es": re.compile(
+        r"(?:\A| )english(?: |\Z)|table of contents|start here|prediction|judges|locks",
+        re.IGNORECASE,
+    ),
+}
 
 
 def audit_language_traces(pdf_path: Path, lang: str) -> dict[str, object]:
     """Heuristic audit for opposite-language traces in a PDF."""
 
-    reader = PdfReader(str(pdf_path))
-    if lang == "en":
-        needles = [" español", " predicción", "jueces", "candados", "metodología"]
-    else:
-        needles = [" english ", "table of contents", "start here", "prediction", "judges", "locks"]
+    return _audit_texts(pdf_path, _extract_pdf_texts(pdf_path), lang)
 
-    pages = []
-    for idx, page in enumerate(reader.pages, start=1):
-        text = f" {_extract_text(page).lower()} "
-        if any(n in text for n in needles):
-            pages.append(idx)
+
+def _audit_texts(pdf_path: Path, texts: Sequence[str], lang: str) -> dict[str, object]:
+    pattern = _AUDIT_NEEDLES_RE["en" if lang == "en" else "es"]
+    pages = [idx for idx, text in enumerate(texts, start=1) if pattern.search(text)]
     return {
         "pdf": str(pdf_path),
         "lang": lang,
-        "total_pages": len(reader.pages),
+        "total_pages": len(texts),
         "opposite_trace_pages": pages,
         "count": len(pages),
     }
 
 
+def _needs_rebuild(path: Path, fingerprint: str) -> bool:
+    """True unless ``path`` was rendered with ``fingerprint`` in its Keywords."""
+
+    try:
+        metadata = PdfReader(str(path)).metadata or {}
+    except (OSError, PdfReadError):
+        return True
+    return metadata.get("/Keywords") != fingerprint
+
+
+def build_languages(
+    base_pdf: Path,
+    langs: Sequence[str],
+    out_pdf: Path | None = None,
+    force_patches: bool = False,
+    audit_lang: bool = False,
+) -> List[dict[str, object]]:
+    """Build each language edition from a single parse of the base compendium.
+
+    Patch PDFs are regenerated only when missing or rendered by a different
+    version of this script (their content is fixed by it and ``lang``), unless
+    ``force_patches`` is set.
+    """
+
+    base = _resolve_base(base_pdf)
+    base_reader = _open_base_reader(base)
+    base_texts = _extract_pdf_texts(base, base_reader)
+    insert_after_page = _find_insert_after_page(base_texts)
+
+    results: List[dict[str, object]] = []
+    for lang in langs:
+        front, section, toc, marker, default_out = LANG_TARGETS[lang]
+        if force_patches or _needs_rebuild(front, _patch_fingerprint("front", lang)):
+            build_front_patch(front, lang)
+        if force_patches or _needs_rebuild(section, _patch_fingerprint("section", lang, marker)):
+            build_integrated_nuclear_section(section, lang, marker)
+        if force_patches or _needs_rebuild(toc, _patch_fingerprint("toc", lang)):
+            build_toc_patch(toc, lang)
+        results.append(
+            build_compendium(
+                base,
+                front,
+                section,
+                toc,
+                out_pdf or default_out,
+                marker,
+                lang,
+                insert_after_page,
+                base_reader=base_reader,
+                base_texts=base_texts,
+                audit_lang=audit_lang,
+            )
+        )
+    return results
+
+
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(
         description="Build integrated OCC compendium PDF with inline nuclear section."
     )
     p.add_argument("--base", type=Path, default=DEFAULT_BASE)
-    p.add_argument("--lang", choices=["en", "es"], default="en")
-    p.add_argument("--out", type=Path, help="Output PDF path")
+    p.add_argument(
+        "--lang",
+        choices=["en", "es", "all"],
+        default="en",
+        help="Edition to build; 'all' builds EN then ES from one parse of the base PDF.",
+    )
+    p.add_argument("--out", type=Path, help="Output PDF path (single-language builds only)")
     p.add_argument(
         "--replace-main",
         action="store_true",
-        help="Overwrite docs/OCC_Compendio_Canonico_Completo.pdf with built output.",
+        help="Overwrite docs/OCC_Compendio_Canonico_Completo.pdf with the first built output.",
+    )
+    p.add_argument(
+        "--force-patches",
+        action="store_true",
+        help="Regenerate the front/section/TOC patch PDFs even if they are up to date.",
     )
     p.add_argument(
         "--audit-lang",
         action="store_true",
         help="Print basic opposite-language trace metrics after building.",
     )
-    return p.parse_args()
+    args = p.parse_args()
+    if args.lang == "all" and args.out is not None:
+        p.error("--out cannot be combined with --lang all")
+    return args
 
 
 def main() -> int:
     args = parse_args()
-    if args.lang == "en":
-        front = FRONT_EN
-        section = SECTION_EN
-        toc = TOC_EN
-        marker = MARKER_EN
-        out = args.out or DEFAULT_OUT_EN
-    else:
-        front = FRONT_ES
-        section = SECTION_ES
-        toc = TOC_ES
-        marker = MARKER_ES
-        out = args.out or DEFAULT_OUT_ES
-
-    base = _resolve_base(args.base)
-    base_reader = PdfReader(str(base))
-    insert_after_page = _find_insert_after_page(base_reader)
-
-    build_front_patch(front, args.lang)
-    build_integrated_nuclear_section(section, args.lang, marker)
-    build_toc_patch(toc, args.lang)
-    result = build_compendium(
-        base,
-        front,
-        section,
-        toc,
-        out,
-        marker,
-        args.lang,
-        insert_after_page,
+    langs = ["en", "es"] if args.lang == "all" else [args.lang]
+    results = build_languages(
+        args.base, langs, args.out, force_patches=args.force_patches, audit_lang=args.audit_lang
     )
 
-    print("Built integrated compendium:")
-    print(f"  lang: {result['lang']}")
-    print(f"  base: {result['base']}")
-    print(f"  front_patch: {result['front_patch']}")
-    print(f"  section: {result['section']}")
-    print(f"  toc_patch: {result['toc_patch']}")
-    print(f"  output: {result['output']}")
-    print(f"  base_pages: {result['base_pages']}")
-    print(f"  section_pages: {result['section_pages']}")
-    print(f"  output_pages: {result['output_pages']}")
-    print(f"  insert_after_page: {result['insert_after_page']}")
-    print(f"  integrated_page: {result['integrated_page']}")
-    print(f"  section_inserted: {result['section_inserted']}")
-    print(f"  already_integrated: {result['already_integrated']}")
-    norm = result["prediction_normalization"]
-    print(
-        "  prediction_normalization: "
-        f"removed={norm['removed_pages']} "
-        f"before={norm['total_before']} after={norm['total_after']}"
-    )
+    for idx, result in enumerate(results):
+        print("Built integrated compendium:")
+        print(f"  lang: {result['lang']}")
+        print(f"  base: {result['base']}")
+        print(f"  front_patch: {result['front_patch']}")
+        print(f"  section: {result['section']}")
+        print(f"  toc_patch: {result['toc_patch']}")
+        print(f"  output: {result['output']}")
+        print(f"  base_pages: {result['base_pages']}")
+        print(f"  section_pages: {result['section_pages']}")
+        print(f"  output_pages: {result['output_pages']}")
+        print(f"  insert_after_page: {result['insert_after_page']}")
+        print(f"  integrated_page: {result['integrated_page']}")
+        print(f"  section_inserted: {result['section_inserted']}")
+        print(f"  already_integrated: {result['already_integrated']}")
+        norm = result["prediction_normalization"]
+        print(
+            "  prediction_normalization: "
+            f"removed={norm['removed_pages']} "
+            f"before={norm['total_before']} after={norm['total_after']}"
+        )
 
-    if args.replace_main:
-        main_pdf = DEFAULT_MAIN
-        main_pdf.write_bytes(Path(str(result["output"])).read_bytes())
-        print(f"  replaced_main: {main_pdf}")
-
-    if args.audit_lang:
-        audit = audit_language_traces(Path(str(result["output"])), args.lang)
-        print("Language trace audit:")
-        print(f"  opposite_trace_count: {audit['count']}")
-        sample = list(audit["opposite_trace_pages"])[:20]
-        print(f"  opposite_trace_pages_sample: {sample}")
+        if args.replace_main and idx == 0:
+            main_pdf = DEFAULT_MAIN
+            main_pdf.write_bytes(Path(str(result["output"])).read_bytes())
+            print(f"  replaced_main: {main_pdf}")
+
+        audit = result.get("language_audit")
+        if isinstance(audit, dict):
+            print("Language trace audit:")
+            print(f"  opposite_trace_count: {audit['count']}")
+            sample = list(audit["opposite_trace_pages"])[:20]
+            print(f"  opposite_trace_pages_sample: {sample}")
 
     return 0
 
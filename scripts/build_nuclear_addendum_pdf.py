@@ -7,16 +7,26 @@ the principal compendium PDF.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import io
 import logging
+import os
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from typing import Iterator, Sequence
 
 from pypdf import PdfReader, PdfWriter
+from pypdf.errors import PdfReadError
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import cm
 from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer
 
+try:  # Optional: PyMuPDF extracts page text much faster than pypdf.
+    import pymupdf
+except ModuleNotFoundError:  # pragma: no cover - pypdf fallback
+    pymupdf = None
+
 ROOT = Path(__file__).resolve().parents[1]
 MAIN_PDF = ROOT / "docs" / "OCC_Compendio_Canonico_Completo.pdf"
 ADDENDUM_PDF = ROOT / "docs" / "canonical" / "OCC_Addendum_Nuclear_v1.4.0.pdf"
@@ -30,6 +40,7 @@ LEGACY_MARKERS = [
 logging.getLogger("pypdf").setLevel(logging.ERROR)
 
 
+@functools.lru_cache(maxsize=1)
 def _styles() -> dict[str, ParagraphStyle]:
     base = getSampleStyleSheet()
     return {
@@ -65,10 +76,33 @@ def _styles() -> dict[str, ParagraphStyle]:
     }
 
 
-def build_addendum_pdf(path: Path) -> None:
+@functools.lru_cache(maxsize=1)
+def _source_fingerprint() -> str:
+    """Hash of this script, which fully determines the addendum's content."""
+
+    digest = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    return f"occ-addendum-src:{digest[:16]}"
+
+
+def _current_addendum(path: Path) -> bytes | None:
+    """Bytes of ``path`` if it was rendered by this exact script version."""
+
+    try:
+        data = path.read_bytes()
+        metadata = PdfReader(io.BytesIO(data)).metadata or {}
+    except (OSError, PdfReadError):
+        return None
+    return data if metadata.get("/Keywords") == _source_fingerprint() else None
+
+
+def build_addendum_pdf(path: Path) -> bytes:
+    """Render the addendum to ``path`` and return the PDF bytes."""
+
     path.parent.mkdir(parents=True, exist_ok=True)
+    buf = io.BytesIO()
     doc = SimpleDocTemplate(
-        str(path),
+        buf,
+        keywords=_source_fingerprint(),
         pagesize=A4,
         topMargin=2.2 * cm,
         leftMargin=2.2 * cm,
@@ -207,27 +241,64 @@ def build_addendum_pdf(path: Path) -> None:
         )
     )
     doc.build(story)
+    data = buf.getvalue()
+    path.write_bytes(data)
+    return data
 
 
-def _find_marker_page(pdf_path: Path, marker: str) -> int | None:
-    reader_main = PdfReader(str(pdf_path))
-    for idx, page in enumerate(reader_main.pages):
-        text = page.extract_text() or ""
-        if marker in text:
-            return idx
-    return None
+def _iter_page_texts(pdf_path: Path, reader: PdfReader) -> Iterator[str]:
+    if pymupdf is None:
+        for page in reader.pages:
+            yield page.extract_text() or ""
+        return
+    with pymupdf.open(pdf_path) as doc:
+        for mu_page in doc:
+            # No clipping: pypdf also returns text that overflows the page box.
+            yield mu_page.get_text(clip=pymupdf.INFINITE_RECT())
 
 
-def integrate_addendum_to_main(main_pdf: Path, addendum_pdf: Path, marker: str) -> str:
-    marker_page = _find_marker_page(main_pdf, marker)
-    if marker_page is None:
-        for legacy in LEGACY_MARKERS:
-            marker_page = _find_marker_page(main_pdf, legacy)
-            if marker_page is not None:
-                break
+def _find_any_marker_page(pdf_path: Path, reader: PdfReader, markers: Sequence[str]) -> int | None:
+    """Return the first page of the highest-priority marker found, in ``markers`` order.
+
+    Each page's text is extracted once; the scan stops early once the first
+    (highest-priority) marker is seen.
+    """
+
+    hits: dict[str, int] = {}
+    for idx, text in enumerate(_iter_page_texts(pdf_path, reader)):
+        for marker in markers:
+            if marker not in hits and marker in text:
+                hits[marker] = idx
+        if markers and markers[0] in hits:
+            break
+    return next((hits[m] for m in markers if m in hits), None)
+
+
+def _ends_with_pages(reader_main: PdfReader, reader_add: PdfReader) -> bool:
+    """True if the main PDF's last pages carry the addendum's content streams."""
+
+    start = len(reader_main.pages) - len(reader_add.pages)
+    if start < 0:
+        return False
+    for page_main, page_add in zip(reader_main.pages[start:], reader_add.pages):
+        contents_main, contents_add = page_main.get_contents(), page_add.get_contents()
+        if contents_main is None or contents_add is None:
+            return False
+        if contents_main.get_data() != contents_add.get_data():
+            return False
+    return True
+
+
+def integrate_addendum_to_main(main_pdf: Path, addendum: bytes, marker: str) -> str:
+    """Splice the rendered ``addendum`` PDF into ``main_pdf``; return the action."""
 
     reader_main = PdfReader(str(main_pdf))
-    reader_add = PdfReader(str(addendum_pdf))
+    reader_add = PdfReader(io.BytesIO(addendum))
+    if _ends_with_pages(reader_main, reader_add):
+        # Same addendum already spliced in: skip the marker scan and the rewrite.
+        return "unchanged"
+
+    marker_page = _find_any_marker_page(main_pdf, reader_main, [marker, *LEGACY_MARKERS])
     writer = PdfWriter()
 
     if marker_page is None:
@@ -246,12 +317,15 @@ def integrate_addendum_to_main(main_pdf: Path, addendum_pdf: Path, marker: str)
     if reader_main.metadata:
         writer.add_metadata(dict(reader_main.metadata))
 
-    with NamedTemporaryFile("wb", delete=False, suffix=".pdf") as tmp:
-        writer.write(tmp)
-        tmp_path = Path(tmp.name)
-
-    main_pdf.write_bytes(tmp_path.read_bytes())
-    tmp_path.unlink(missing_ok=True)
+    # Write next to the main PDF and swap it in: no read-back copy, and a
+    # failed write never leaves a truncated compendium behind.
+    tmp_path = main_pdf.with_name(main_pdf.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as fh:
+            writer.write(fh)
+        os.replace(tmp_path, main_pdf)
+    finally:
+        tmp_path.unlink(missing_ok=True)
     return action
 
 
@@ -259,8 +333,8 @@ def main() -> int:
     if not MAIN_PDF.is_file():
         raise SystemExit(f"Main PDF not found: {MAIN_PDF}")
 
-    build_addendum_pdf(ADDENDUM_PDF)
-    action = integrate_addendum_to_main(MAIN_PDF, ADDENDUM_PDF, MARKER)
+    addendum = _current_addendum(ADDENDUM_PDF) or build_addendum_pdf(ADDENDUM_PDF)
+    action = integrate_addendum_to_main(MAIN_PDF, addendum, MARKER)
     print(f"{action.title()} nuclear addendum v1.4.0 in main compendium: {MAIN_PDF}")
     print(f"Addendum PDF: {ADDENDUM_PDF}")
     return 0
@@ -8,7 +8,7 @@ import json
 import re
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 @dataclass
@@ -20,7 +20,8 @@ class Issue:
 
 LINK_RE = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
 HEADING_RE = re.compile(r"^(#{2,3})\s+(.+?)\s*$")
-CODE_BLOCK_RE = re.compile(r"```(?:bash|sh|powershell|pwsh|console|text)?\n(.*?)\n```", re.DOTALL)
+# Fenced code blocks whose lines count as command examples.
+SHELL_FENCES = frozenset({"", "bash", "sh", "powershell", "pwsh", "console", "text"})
 CMD_RE = re.compile(r"^\s*(occ|make|python|pytest|ruff|mypy|mkdocs)\b")
 
 
@@ -28,25 +29,22 @@ def _read(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def _heading_profile(text: str) -> Dict[int, int]:
-    out: Dict[int, int] = {2: 0, 3: 0}
+def _scan_markdown(text: str) -> Tuple[Dict[int, int], int]:
+    """Return (H2/H3 heading counts, shell command examples) in one pass."""
+
+    headings: Dict[int, int] = {2: 0, 3: 0}
+    commands = 0
+    fence: Optional[str] = None  # info string of the open code block
     for line in text.splitlines():
-        m = HEADING_RE.match(line)
-        if not m:
+        if line.startswith("```"):
+            fence = line[3:].strip() if fence is None else None
             continue
-        level = len(m.group(1))
-        if level in out:
-            out[level] += 1
-    return out
-
-
-def _command_count(text: str) -> int:
-    total = 0
-    for block in CODE_BLOCK_RE.findall(text):
-        for line in block.splitlines():
-            if CMD_RE.match(line):
-                total += 1
-    return total
+        if fence is not None and fence in SHELL_FENCES and CMD_RE.match(line):
+            commands += 1
+        m = HEADING_RE.match(line)
+        if m and len(m.group(1)) in headings:
+            headings[len(m.group(1))] += 1
+    return headings, commands
 
 
 def _local_links(path: Path, text: str) -> Iterable[Tuple[str, Path]]:
@@ -82,6 +80,13 @@ def _pair_files(root: Path) -> List[Tuple[Path, Path]]:
 def run_audit(root: Path) -> List[Issue]:
     issues: List[Issue] = []
     pairs = _pair_files(root)
+    # README/docs files feed both the pair and the link audit; read each once.
+    texts: Dict[Path, str] = {}
+
+    def text_of(path: Path) -> str:
+        if path not in texts:
+            texts[path] = _read(path)
+        return texts[path]
 
     for en, es in pairs:
         if not en.is_file():
@@ -92,11 +97,11 @@ def run_audit(root: Path) -> List[Issue]:
             )
             continue
 
-        en_text = _read(en)
-        es_text = _read(es)
+        en_text = text_of(en)
+        es_text = text_of(es)
 
-        en_head = _heading_profile(en_text)
-        es_head = _heading_profile(es_text)
+        en_head, en_cmds = _scan_markdown(en_text)
+        es_head, es_cmds = _scan_markdown(es_text)
         for level in (2, 3):
             if abs(en_head[level] - es_head[level]) > 1:
                 issues.append(
@@ -107,8 +112,6 @@ def run_audit(root: Path) -> List[Issue]:
                     )
                 )
 
-        en_cmds = _command_count(en_text)
-        es_cmds = _command_count(es_text)
         if abs(en_cmds - es_cmds) > 2:
             issues.append(
                 Issue(
@@ -121,7 +124,7 @@ def run_audit(root: Path) -> List[Issue]:
     for md in [p for p in [root / "README.md", root / "README.es.md"] if p.is_file()] + sorted(
         (root / "docs").glob("*.md")
     ):
-        text = _read(md)
+        text = text_of(md)
         for raw, resolved in _local_links(md, text):
             if not resolved.exists():
                 issues.append(
@@ -4,9 +4,11 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, List
@@ -33,7 +35,10 @@ def _run_gh(args: List[str]) -> subprocess.CompletedProcess[str]:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def _require_gh() -> None:
+    """Check gh is installed and authenticated; only a successful check is cached."""
+
     if shutil.which("gh") is None:
         raise RuntimeError("gh CLI is not installed. Install from https://cli.github.com/")
 
@@ -51,6 +56,26 @@ def _json_or_empty(proc: subprocess.CompletedProcess[str]) -> Any:
         return None
 
 
+BAD_CONCLUSIONS = {"failure", "cancelled", "timed_out", "action_required", "startup_failure"}
+# Concurrent `gh run view` calls; each is one short HTTP round-trip.
+MAX_VIEW_WORKERS = 8
+
+
+def _failing_jobs(run_id: int) -> List[str]:
+    details = _json_or_empty(_run_gh(["run", "view", str(run_id), "--json", "jobs"]))
+    jobs: List[str] = []
+    if isinstance(details, dict):
+        raw_jobs = details.get("jobs")
+        if isinstance(raw_jobs, list):
+            for job in raw_jobs:
+                if not isinstance(job, dict):
+                    continue
+                jc = str(job.get("conclusion") or "")
+                if jc in BAD_CONCLUSIONS:
+                    jobs.append(str(job.get("name") or "unknown-job"))
+    return jobs
+
+
 def collect_findings(limit: int, workflow: str | None) -> List[RunFinding]:
     _require_gh()
 
@@ -63,44 +88,32 @@ def collect_findings(limit: int, workflow: str | None) -> List[RunFinding]:
     if not isinstance(raw, list):
         raise RuntimeError(f"Could not read run list: {proc.stderr.strip() or proc.stdout.strip()}")
 
-    bad = {"failure", "cancelled", "timed_out", "action_required", "startup_failure"}
-
-    failures: List[RunFinding] = []
-    for item in raw:
-        if not isinstance(item, dict):
-            continue
-        conclusion = str(item.get("conclusion") or "")
-        if conclusion not in bad:
-            continue
-
-        run_id = int(item.get("databaseId") or 0)
-        view = _run_gh(["run", "view", str(run_id), "--json", "jobs"])
-        details = _json_or_empty(view)
-
-        jobs: List[str] = []
-        if isinstance(details, dict):
-            raw_jobs = details.get("jobs")
-            if isinstance(raw_jobs, list):
-                for job in raw_jobs:
-                    if not isinstance(job, dict):
-                        continue
-                    jc = str(job.get("conclusion") or "")
-                    if jc in bad:
-                        jobs.append(str(job.get("name") or "unknown-job"))
-
-        failures.append(
-            RunFinding(
-                run_id=run_id,
-                workflow=str(item.get("workflowName") or item.get("name") or ""),
-                title=str(item.get("displayTitle") or ""),
-                branch=str(item.get("headBranch") or ""),
-                status=str(item.get("status") or ""),
-                conclusion=conclusion,
-                url=str(item.get("url") or ""),
-                failing_jobs=jobs,
-            )
+    failed = [
+        item
+        for item in raw
+        if isinstance(item, dict) and str(item.get("conclusion") or "") in BAD_CONCLUSIONS
+    ]
+    if not failed:
+        return []
+
+    run_ids = [int(item.get("databaseId") or 0) for item in failed]
+    # Job details need one `gh run view` per run; fetch them concurrently.
+    with ThreadPoolExecutor(max_workers=min(MAX_VIEW_WORKERS, len(run_ids))) as pool:
+        jobs_by_run = list(pool.map(_failing_jobs, run_ids))
+
+    return [
+        RunFinding(
+            run_id=run_id,
+            workflow=str(item.get("workflowName") or item.get("name") or ""),
+            title=str(item.get("displayTitle") or ""),
+            branch=str(item.get("headBranch") or ""),
+            status=str(item.get("status") or ""),
+            conclusion=str(item.get("conclusion") or ""),
+            url=str(item.get("url") or ""),
+            failing_jobs=jobs,
         )
-    return failures
+        for item, run_id, jobs in zip(failed, run_ids, jobs_by_run)
+    ]
 
 
 def main() -> int:
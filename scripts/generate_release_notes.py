@@ -20,13 +20,19 @@ except ModuleNotFoundError:
     from occ.util import simple_yaml as yaml
 
 
+VERSION_LINE_RE = re.compile(r'^\s*version\s*=\s*"([^"]+)"\s*$', re.MULTILINE)
+SECTION_HEADING_RE = re.compile(r"^## \[", re.MULTILINE)
+# Commit subjects too generic to be worth a release-notes bullet.
+LOW_SIGNAL_SUBJECTS = frozenset({"up", "wip", "fix", "update", "changes"})
+
+
 def _read(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
 def _project_version(pyproject: Path) -> str:
     text = _read(pyproject)
-    m = re.search(r'^\s*version\s*=\s*"([^"]+)"\s*$', text, flags=re.MULTILINE)
+    m = VERSION_LINE_RE.search(text)
     if not m:
         raise RuntimeError("Could not parse version from pyproject.toml")
     return m.group(1).strip()
@@ -46,8 +52,8 @@ def _extract_changelog_section(changelog: Path, version: str) -> str:
     if not m:
         return ""
     start = m.end()
-    end_m = re.search(r"^## \[", text[start:], flags=re.MULTILINE)
-    end = start + end_m.start() if end_m else len(text)
+    end_m = SECTION_HEADING_RE.search(text, start)
+    end = end_m.start() if end_m else len(text)
     return text[start:end].strip()
 
 
@@ -59,8 +65,17 @@ def _git(args: List[str], cwd: Path) -> str:
 
 
 def _previous_tag(cwd: Path) -> str:
-    tags = _git(["tag", "--sort=-creatordate"], cwd).splitlines()
-    return tags[0].strip() if tags else ""
+    # Same order as `git tag --sort=-creatordate`, but git stops after the first.
+    return _git(
+        [
+            "for-each-ref",
+            "--sort=-creatordate",
+            "--count=1",
+            "--format=%(refname:lstrip=2)",
+            "refs/tags",
+        ],
+        cwd,
+    )
 
 
 def _commit_highlights(cwd: Path, since_ref: Optional[str], max_items: int) -> List[str]:
@@ -68,17 +83,19 @@ def _commit_highlights(cwd: Path, since_ref: Optional[str], max_items: int) -> L
     if since_ref:
         range_expr = f"{since_ref}..HEAD"
     out = _git(["log", range_expr, "--pretty=format:%s"], cwd)
-    lines = [x.strip() for x in out.splitlines() if x.strip()]
+    limit = max(1, max_items)
     clean: List[str] = []
-    low_signal = {"up", "wip", "fix", "update", "changes"}
-    for line in lines:
+    for raw in out.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
         low = line.lower()
         if low.startswith("merge "):
             continue
-        if low in low_signal:
+        if low in LOW_SIGNAL_SUBJECTS:
             continue
         clean.append(line)
-        if len(clean) >= max(1, max_items):
+        if len(clean) >= limit:
             break
     return clean
 
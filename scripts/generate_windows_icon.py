@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
-"""Generate OCC desktop branding icon assets without external dependencies."""
+"""Generate OCC desktop branding icon assets without external dependencies.
+
+NumPy (an OCC runtime dependency) is used to rasterize when importable; the
+pure-Python path produces the same pixels.
+"""
 
 from __future__ import annotations
 
@@ -8,6 +12,11 @@ import struct
 import zlib
 from pathlib import Path
 
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - pure-Python fallback
+    np = None  # type: ignore[assignment]
+
 
 def _png_chunk(tag: bytes, payload: bytes) -> bytes:
     return (
@@ -18,13 +27,44 @@ def _png_chunk(tag: bytes, payload: bytes) -> bytes:
     )
 
 
-def build_brand_png(width: int = 256, height: int = 256) -> bytes:
-    if width <= 0 or height <= 0:
-        raise ValueError("Invalid icon dimensions.")
+def _radius_bounds(width: int) -> tuple[float, float, float]:
+    """Squared (ring inner, ring outer, disk) radii; pixels compare ``dx²+dy²``."""
+
+    return (width * 0.22) ** 2, (width * 0.34) ** 2, (width * 0.20) ** 2
+
+
+def _brand_rows_numpy(width: int, height: int) -> bytes:
+    """Vectorized ``_brand_rows``: same per-pixel rules as whole-image masks."""
+
+    assert np is not None
+    y = np.arange(height, dtype=np.int64)[:, None]
+    x = np.arange(width, dtype=np.int64)[None, :]
+    img = np.empty((height, width, 4), dtype=np.uint8)
+    img[..., 0] = (8 + (24 * y / max(height - 1, 1))).astype(np.uint8)
+    img[..., 1] = (24 + (92 * x / max(width - 1, 1))).astype(np.uint8)
+    img[..., 2] = (44 + (146 * y / max(height - 1, 1))).astype(np.uint8)
+    img[..., 3] = 255
 
+    ring_lo2, ring_hi2, disk2 = _radius_bounds(width)
+    dx = x - width // 2
+    dy = y - height // 2
+    r2 = dx * dx + dy * dy
+    img[(ring_lo2 <= r2) & (r2 <= ring_hi2), :3] = (56, 189, 248)
+    img[r2 < disk2, :3] = (15, 23, 42)
+    bar = (np.abs(dy) < max(2, height // 28)) & (np.abs(dx) < width * 0.28)
+    img[bar, :3] = (245, 248, 255)
+
+    # Prefix every scanline with PNG filter type 0.
+    rows = np.zeros((height, 1 + width * 4), dtype=np.uint8)
+    rows[:, 1:] = img.reshape(height, width * 4)
+    return rows.tobytes()
+
+
+def _brand_rows(width: int, height: int) -> bytes:
     rows = bytearray()
     cx = width // 2
     cy = height // 2
+    ring_lo2, ring_hi2, disk2 = _radius_bounds(width)
 
     for y in range(height):
         rows.append(0)  # PNG filter type 0
@@ -36,14 +76,14 @@ def build_brand_png(width: int = 256, height: int = 256) -> bytes:
 
             dx = x - cx
             dy = y - cy
-            radius = (dx * dx + dy * dy) ** 0.5
+            r2 = dx * dx + dy * dy
 
             # Bright ring around the center "O"
-            if width * 0.22 <= radius <= width * 0.34:
+            if ring_lo2 <= r2 <= ring_hi2:
                 r, g, b = 56, 189, 248
 
             # Inner disk
-            if radius < width * 0.20:
+            if r2 < disk2:
                 r, g, b = 15, 23, 42
 
             # Horizontal bar across the center to stylize OCC glyph
@@ -51,9 +91,19 @@ def build_brand_png(width: int = 256, height: int = 256) -> bytes:
                 r, g, b = 245, 248, 255
 
             rows.extend((r, g, b, a))
+    return bytes(rows)
+
+
+def build_brand_png(width: int = 256, height: int = 256) -> bytes:
+    if width <= 0 or height <= 0:
+        raise ValueError("Invalid icon dimensions.")
 
+    if np is not None:
+        rows = _brand_rows_numpy(width, height)
+    else:
+        rows = _brand_rows(width, height)
     ihdr = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
-    data = zlib.compress(bytes(rows), level=9)
+    data = zlib.compress(rows, level=9)
     signature = b"\x89PNG\r\n\x1a\n"
     return (
         signature
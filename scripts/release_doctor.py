@@ -12,8 +12,6 @@ from __future__ import annotations
 import argparse
 import json
 import re
-import urllib.error
-import urllib.request
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -37,6 +35,7 @@ class Check:
 
 
 DOI_RE = re.compile(r"https://doi\.org/(10\.\d{4,9}/[-._;()/:A-Za-z0-9]+)")
+VERSION_LINE_RE = re.compile(r'^\s*version\s*=\s*"([^"]+)"\s*$', re.MULTILINE)
 
 
 def _read_text(path: Path) -> str:
@@ -45,7 +44,7 @@ def _read_text(path: Path) -> str:
 
 def _pyproject_version(pyproject: Path) -> Optional[str]:
     text = _read_text(pyproject)
-    m = re.search(r'^\s*version\s*=\s*"([^"]+)"\s*$', text, flags=re.MULTILINE)
+    m = VERSION_LINE_RE.search(text)
     if not m:
         return None
     return m.group(1).strip()
@@ -82,6 +81,11 @@ def _has_versioned_asset_link(text: str, version: str, asset_name: str) -> bool:
 
 
 def _resolve_doi(doi: str, timeout_s: int = 12) -> Tuple[bool, str]:
+    # Imported here: urllib.request pulls in http.client/email (~30ms) and is
+    # only needed when DOI resolution is enabled.
+    import urllib.error
+    import urllib.request
+
     url = f"https://doi.org/{doi}"
     req = urllib.request.Request(url, method="HEAD")
     try:
@@ -6,27 +6,46 @@ correctly and that the `occ` entrypoint can execute.
 
 from __future__ import annotations
 
+import contextlib
+import io
 import subprocess
 import sys
 
+from occ import cli
+
 
 def _occ(*args: str) -> subprocess.CompletedProcess[str]:
-    """Run the CLI using the current interpreter.
+    """Run the CLI in this interpreter and capture its output.
 
-    This avoids PATH issues in CI environments.
+    ``cli.main`` is called directly to skip interpreter startup; only
+    ``test_occ_help`` goes through ``python -m occ.cli``.
     """
 
-    return subprocess.run(
-        [sys.executable, "-m", "occ.cli", *args],
-        capture_output=True,
-        text=True,
-    )
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            rc = cli.main(list(args))
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                rc = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                rc = 1
+    return subprocess.CompletedProcess(["occ", *args], rc, out.getvalue(), err.getvalue())
 
 
 def test_occ_help() -> None:
-    """`occ --help` should exit successfully."""
-    proc = _occ("--help")
+    """`python -m occ.cli --help` should exit successfully.
+
+    Runs in a subprocess to keep the module entrypoint covered.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-m", "occ.cli", "--help"],
+        capture_output=True,
+        text=True,
+    )
     assert proc.returncode == 0, proc.stderr
+    assert "usage:" in proc.stdout
 
 
 def test_occ_list() -> None:
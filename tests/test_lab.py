@@ -1,33 +1,30 @@
 from __future__ import annotations
 
 import json
-import subprocess
-import sys
 from pathlib import Path
 
+import pytest
+
+from occ import cli
 from occ.lab import LabConfig, run_experiment_lab
 
+_MINIMAL_CLAIM_YAML = """\
+claim_id: CLAIM-LAB-001
+title: Lab pass claim
+domain:
+  omega_I: demo
+  observables:
+    - O1
+parameters:
+  - name: theta
+    accessible: true
+    affects_observables: true
+"""
+
 
 def test_run_experiment_lab_artifacts(tmp_path: Path) -> None:
     claim = tmp_path / "claim.yaml"
-    claim.write_text(
-        "\n".join(
-            [
-                "claim_id: CLAIM-LAB-001",
-                "title: Lab pass claim",
-                "domain:",
-                "  omega_I: demo",
-                "  observables:",
-                "    - O1",
-                "parameters:",
-                "  - name: theta",
-                "    accessible: true",
-                "    affects_observables: true",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
+    claim.write_text(_MINIMAL_CLAIM_YAML, encoding="utf-8")
     out_dir = tmp_path / "lab_out"
     payload = run_experiment_lab(
         LabConfig(
@@ -47,13 +44,10 @@ def test_run_experiment_lab_artifacts(tmp_path: Path) -> None:
     assert Path(str(artifacts["matrix_md"])).is_file()
 
 
-def test_cli_lab_fail_on_non_pass(tmp_path: Path) -> None:
+def test_cli_lab_fail_on_non_pass(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
     out_dir = tmp_path / "lab_cli_out"
-    proc = subprocess.run(
+    rc = cli.main(
         [
-            sys.executable,
-            "-m",
-            "occ.cli",
             "lab",
             "run",
             "--claims",
@@ -64,12 +58,9 @@ def test_cli_lab_fail_on_non_pass(tmp_path: Path) -> None:
             str(out_dir),
             "--fail-on-non-pass",
             "--json",
-        ],
-        capture_output=True,
-        text=True,
-        check=False,
+        ]
     )
-    assert proc.returncode == 1
-    payload = json.loads(proc.stdout)
+    assert rc == 1
+    payload = json.loads(capsys.readouterr().out)
     assert payload["totals"]["runs"] == 1
     assert payload["totals"]["no_eval"] >= 1
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
 import pytest
@@ -8,21 +9,29 @@ from occ.module_autogen import auto_generate_module
 from occ.suites import SUITE_EXTENSIONS
 
 
-def _bootstrap_repo(tmp_path: Path) -> None:
-    (tmp_path / "pyproject.toml").write_text(
+@pytest.fixture(scope="session")
+def bootstrap_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    root = tmp_path_factory.mktemp("bootstrap_tpl")
+    (root / "pyproject.toml").write_text(
         "[project]\nname='x'\nversion='0.0.0'\n",
         encoding="utf-8",
     )
-    ext = tmp_path / SUITE_EXTENSIONS
+    ext = root / SUITE_EXTENSIONS
     ext.mkdir(parents=True, exist_ok=True)
     (ext / "manifest.yaml").write_text("version: 1\n\nmodules: []\n", encoding="utf-8")
-    pred_root = tmp_path / "predictions"
+    pred_root = root / "predictions"
     pred_root.mkdir(parents=True, exist_ok=True)
     (pred_root / "registry.yaml").write_text("version: 1\npredictions: []\n", encoding="utf-8")
+    return root
 
 
+@pytest.fixture
+def bootstrap_repo(tmp_path: Path, bootstrap_template: Path) -> None:
+    shutil.copytree(bootstrap_template, tmp_path, dirs_exist_ok=True)
+
+
+@pytest.mark.usefixtures("bootstrap_repo")
 def test_auto_generate_module_and_prediction_draft(tmp_path: Path) -> None:
-    _bootstrap_repo(tmp_path)
     claim = tmp_path / "claim.yaml"
     claim.write_text(
         "\n".join(
@@ -62,8 +71,8 @@ def test_auto_generate_module_and_prediction_draft(tmp_path: Path) -> None:
     assert str(out["module"]) in manifest
 
 
+@pytest.mark.usefixtures("bootstrap_repo")
 def test_auto_generate_detects_existing_module(tmp_path: Path) -> None:
-    _bootstrap_repo(tmp_path)
     existing = tmp_path / SUITE_EXTENSIONS / "mrd_existing"
     existing.mkdir(parents=True, exist_ok=True)
     (existing / "scripts").mkdir(exist_ok=True)
@@ -92,8 +101,8 @@ def test_auto_generate_detects_existing_module(tmp_path: Path) -> None:
     assert out["module"] == "mrd_existing"
 
 
+@pytest.mark.usefixtures("bootstrap_repo")
 def test_auto_generate_validates_claim_shape(tmp_path: Path) -> None:
-    _bootstrap_repo(tmp_path)
     claim = tmp_path / "invalid_claim.yaml"
     claim.write_text(
         "\n".join(
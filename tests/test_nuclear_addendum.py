@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pypdf")
+pytest.importorskip("reportlab")
+
+from pypdf import PdfReader  # noqa: E402
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "build_nuclear_addendum_pdf.py"
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("build_nuclear_addendum_pdf", SCRIPT)
+    assert spec and spec.loader
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _write_pdf(path: Path, pages: list[str]) -> None:
+    from reportlab.pdfgen import canvas
+
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf)
+    for text in pages:
+        c.drawString(72, 720, text)
+        c.showPage()
+    c.save()
+    path.write_bytes(buf.getvalue())
+
+
+def test_marker_priority_beats_earlier_legacy_marker(tmp_path: Path) -> None:
+    mod = _load_script()
+    pdf = tmp_path / "main.pdf"
+    legacy = mod.LEGACY_MARKERS[0]
+    _write_pdf(pdf, ["Intro", f"See {legacy}", "Body", f"Addendum {mod.MARKER}"])
+    markers = [mod.MARKER, *mod.LEGACY_MARKERS]
+
+    assert mod._find_any_marker_page(pdf, PdfReader(str(pdf)), markers) == 3
+
+    _write_pdf(pdf, ["Intro", f"See {legacy}", "Body"])
+    assert mod._find_any_marker_page(pdf, PdfReader(str(pdf)), markers) == 1
+
+    _write_pdf(pdf, ["Intro", "Body"])
+    assert mod._find_any_marker_page(pdf, PdfReader(str(pdf)), markers) is None
@@ -1,13 +1,30 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Sequence
 
 import pytest
 
-from occ.runner import extract_verdict_from_report, run_bundle
-from occ.suites import SUITE_EXTENSIONS
+from occ.runner import (
+    discover_module_runner,
+    extract_verdict_from_report,
+    infer_module_from_yaml_path,
+    newest_report,
+    run_bundle,
+    run_verify_parallel,
+)
+from occ.suites import (
+    SUITE_CANON,
+    SUITE_EXTENSIONS,
+    build_suite_index,
+    clear_discovery_caches,
+    find_suite_root,
+)
 
 
 def _write_runner(path: Path, code: str) -> None:
@@ -20,6 +37,37 @@ def _write_bundle(path: Path) -> None:
     path.write_text("claim_id: TEST\n", encoding="utf-8")
 
 
+_SUITE_RUNNER = """
+import argparse, json, sys
+from pathlib import Path
+
+FAILING = {failing!r}
+
+ap = argparse.ArgumentParser()
+ap.add_argument("--root")
+ap.add_argument("--summary")
+ap.add_argument("--timeout")
+ap.add_argument("--strict", action="store_true")
+ap.add_argument("--only", action="append")
+args = ap.parse_args()
+if args.only is None:
+    out = {{"only": None}}
+elif FAILING.intersection(args.only):
+    sys.exit(3)
+else:
+    out = {{m: {{"cases": {{"pass": {{"verdict": "PASS"}}}}}} for m in args.only}}
+Path(args.summary).write_text(json.dumps(out), encoding="utf-8")
+"""
+
+
+def _write_suite_runner(suite: Path, modules: Sequence[str], failing: Sequence[str] = ()) -> None:
+    """Stub ``RUN_ALL.py``: PASS per ``--only`` module, exit 3 for ``failing`` ones."""
+
+    for name in modules:
+        (suite / name).mkdir(parents=True)
+    _write_runner(suite / "RUN_ALL.py", _SUITE_RUNNER.format(failing=set(failing)))
+
+
 def test_run_bundle_uses_new_report_not_stale(tmp_path: Path) -> None:
     suite = tmp_path / SUITE_EXTENSIONS
     module = suite / "mrd_fake"
@@ -50,6 +98,21 @@ def test_run_bundle_uses_new_report_not_stale(tmp_path: Path) -> None:
     assert verdict == "PASS(FRESH)"
 
 
+def test_newest_report_matches_glob_candidates(tmp_path: Path) -> None:
+    outputs = tmp_path / "outputs"
+    outputs.mkdir()
+    visible = outputs / "a.report.json"
+    hidden = outputs / ".b.report.json"
+    visible.write_text("{}", encoding="utf-8")
+    hidden.write_text("{}", encoding="utf-8")
+    (outputs / "notes.json").write_text("{}", encoding="utf-8")
+    os.utime(visible, ns=(1_000_000_000, 1_000_000_000))
+
+    assert set(outputs.glob("*.report.json")) == {visible, hidden}
+    assert newest_report(outputs) == hidden
+    assert newest_report(tmp_path / "missing") is None
+
+
 def test_run_bundle_timeout(tmp_path: Path) -> None:
     suite = tmp_path / SUITE_EXTENSIONS
     module = suite / "mrd_slow"
@@ -66,4 +129,267 @@ def test_run_bundle_timeout(tmp_path: Path) -> None:
     _write_bundle(bundle)
 
     with pytest.raises(RuntimeError, match="timed out"):
-        run_bundle(bundle, module="mrd_slow", suite="extensions", timeout=1)
+        run_bundle(bundle, module="mrd_slow", suite="extensions", timeout=0.2)
+
+
+def test_run_verify_parallel_merges_module_summaries(tmp_path: Path) -> None:
+    suite = tmp_path / SUITE_CANON
+    _write_suite_runner(suite, ("mrd_a", "mrd_b", "mrd_c"))
+
+    rc, summary = run_verify_parallel(suite, workers=2)
+    assert rc == 0
+    assert summary == suite / "verification_summary.json"
+    data = json.loads(summary.read_text(encoding="utf-8"))
+    assert list(data) == ["mrd_a", "mrd_b", "mrd_c"]
+    assert data["mrd_b"]["cases"]["pass"]["verdict"] == "PASS"
+
+
+def test_run_verify_parallel_reports_failing_module(tmp_path: Path) -> None:
+    suite = tmp_path / SUITE_CANON
+    _write_suite_runner(suite, ("mrd_a", "mrd_b", "mrd_c"), failing=("mrd_b",))
+
+    rc, summary = run_verify_parallel(suite, workers=2)
+    assert rc == 3
+    assert summary is not None
+    data = json.loads(summary.read_text(encoding="utf-8"))
+    assert list(data) == ["mrd_a", "mrd_b", "mrd_c"]
+    assert data["mrd_b"] == {"error": "suite runner failed (rc=3)"}
+    assert data["mrd_c"]["cases"]["pass"]["verdict"] == "PASS"
+
+
+def test_run_verify_parallel_single_worker_runs_suite_once(tmp_path: Path) -> None:
+    suite = tmp_path / SUITE_CANON
+    _write_suite_runner(suite, ("mrd_a", "mrd_b"))
+
+    rc, summary = run_verify_parallel(suite, workers=1)
+    assert rc == 0
+    assert summary is not None
+    assert json.loads(summary.read_text(encoding="utf-8")) == {"only": None}
+
+
+def test_run_bundle_inproc_restores_process_state(tmp_path: Path) -> None:
+    suite = tmp_path / SUITE_EXTENSIONS
+    module = suite / "mrd_inproc"
+    runner = module / "scripts" / "run_mrd_inproc.py"
+    _write_runner(
+        runner,
+        """
+        import json
+        import sys
+        from pathlib import Path
+
+        sys.path.insert(0, "injected")
+        Path("outputs", "inproc.report.json").write_text(
+            json.dumps({"verdict": "FAIL(X1)", "input": sys.argv[1]}), encoding="utf-8"
+        )
+        sys.exit(3)
+        """,
+    )
+    bundle = module / "inputs" / "fail.yaml"
+    _write_bundle(bundle)
+
+    cwd, argv, path = Path.cwd(), sys.argv[:], sys.path[:]
+    res = run_bundle(bundle, module="mrd_inproc", suite="extensions", inproc=True)
+    assert res.returncode == 3
+    assert res.report_path is not None
+    assert extract_verdict_from_report(Path(res.report_path)) == "FAIL(X1)"
+    assert (Path.cwd(), sys.argv, sys.path) == (cwd, argv, path)
+
+
+def test_run_bundle_inproc_evicts_only_module_local_imports(tmp_path: Path) -> None:
+    site = tmp_path / "site"
+    _write_runner(site / "occ_inproc_site_dep.py", "")
+    suite = tmp_path / SUITE_EXTENSIONS
+    module = suite / "mrd_local"
+    _write_runner(module / "src" / "occ_inproc_local_pkg" / "__init__.py", "")
+    _write_runner(
+        module / "scripts" / "run_mrd_local.py",
+        f"""
+        import sys
+        from pathlib import Path
+
+        sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+        sys.path.insert(0, {str(site)!r})
+        import occ_inproc_local_pkg
+        import occ_inproc_site_dep
+        """,
+    )
+    bundle = module / "inputs" / "pass.yaml"
+    _write_bundle(bundle)
+
+    try:
+        res = run_bundle(bundle, module="mrd_local", suite="extensions", inproc=True)
+        assert res.returncode == 0
+        assert "occ_inproc_local_pkg" not in sys.modules
+        dep = sys.modules["occ_inproc_site_dep"]
+        res = run_bundle(bundle, module="mrd_local", suite="extensions", inproc=True)
+        assert res.returncode == 0
+        assert sys.modules["occ_inproc_site_dep"] is dep
+    finally:
+        sys.modules.pop("occ_inproc_site_dep", None)
+
+
+def test_run_bundle_inproc_twice_with_numpy(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    suite = tmp_path / SUITE_EXTENSIONS
+    module = suite / "mrd_numpy"
+    _write_runner(
+        module / "scripts" / "run_mrd_numpy.py",
+        """
+        import json
+        from pathlib import Path
+
+        import numpy as np
+
+        Path("outputs", "np.report.json").write_text(
+            json.dumps({"verdict": "PASS", "sum": float(np.arange(4).sum())}), encoding="utf-8"
+        )
+        """,
+    )
+    bundle = module / "inputs" / "pass.yaml"
+    _write_bundle(bundle)
+
+    for _ in range(2):
+        res = run_bundle(bundle, module="mrd_numpy", suite="extensions", inproc=True)
+        assert res.returncode == 0
+        assert res.report_path is not None
+        assert extract_verdict_from_report(Path(res.report_path)) == "PASS"
+
+
+def test_run_bundle_inproc_from_threads_is_serialized(tmp_path: Path) -> None:
+    suite = tmp_path / SUITE_EXTENSIONS
+    module = suite / "mrd_threads"
+    _write_runner(
+        module / "scripts" / "run_mrd_threads.py",
+        """
+        import json
+        import sys
+        import time
+        from pathlib import Path
+
+        bundle = Path(sys.argv[1])
+        time.sleep(0.05)
+        assert Path.cwd().name == "mrd_threads"
+        Path("outputs", bundle.stem + ".report.json").write_text(
+            json.dumps({"verdict": bundle.stem.upper()}), encoding="utf-8"
+        )
+        """,
+    )
+    bundles = []
+    for name in ("pass", "fail", "noeval"):
+        bundle = module / "inputs" / f"{name}.yaml"
+        _write_bundle(bundle)
+        bundles.append(bundle)
+
+    cwd = Path.cwd()
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(
+            pool.map(
+                lambda b: run_bundle(b, module="mrd_threads", suite="extensions", inproc=True),
+                bundles,
+            )
+        )
+    assert [r.returncode for r in results] == [0, 0, 0]
+    assert sorted(
+        extract_verdict_from_report(Path(r.report_path)) for r in results if r.report_path
+    ) == ["FAIL", "NOEVAL", "PASS"]
+    assert Path.cwd() == cwd
+
+
+def test_discover_module_runner_is_cached_until_cleared(tmp_path: Path) -> None:
+    module = tmp_path / "mrd_cached"
+    _write_runner(module / "scripts" / "run_other.py", "")
+    assert discover_module_runner(module) == module / "scripts" / "run_other.py"
+
+    _write_runner(module / "scripts" / "run_mrd_cached.py", "")
+    assert discover_module_runner(module) == module / "scripts" / "run_other.py"
+
+    clear_discovery_caches()
+    assert discover_module_runner(module) == module / "scripts" / "run_mrd_cached.py"
+
+
+def test_discovery_misses_are_not_cached(tmp_path: Path) -> None:
+    module = tmp_path / "mrd_late"
+    module.mkdir()
+    assert discover_module_runner(module) is None
+    assert find_suite_root(tmp_path, "mrd_late_suite") is None
+
+    _write_runner(module / "scripts" / "run_mrd_late.py", "")
+    (tmp_path / "mrd_late_suite").mkdir()
+    assert discover_module_runner(module) == module / "scripts" / "run_mrd_late.py"
+    assert find_suite_root(tmp_path, "mrd_late_suite") == tmp_path / "mrd_late_suite"
+
+
+def test_build_suite_index_is_a_snapshot_until_cleared(tmp_path: Path) -> None:
+    suite = tmp_path / SUITE_EXTENSIONS
+    (suite / "mrd_first").mkdir(parents=True)
+    assert list(build_suite_index(suite).modules) == ["mrd_first"]
+
+    (suite / "mrd_second").mkdir()
+    assert list(build_suite_index(suite).modules) == ["mrd_first"]
+
+    clear_discovery_caches()
+    assert list(build_suite_index(suite).modules) == ["mrd_first", "mrd_second"]
+
+
+def test_build_suite_index_maps_runners(tmp_path: Path) -> None:
+    suite = tmp_path / SUITE_EXTENSIONS
+    module = suite / "mrd_indexed"
+    _write_runner(module / "scripts" / "run_helper.py", "raise SystemExit(9)")
+    _write_runner(module / "scripts" / "run_mrd_indexed.py", "")
+
+    index = build_suite_index(suite)
+    assert list(index.modules) == ["mrd_indexed"]
+    assert index.modules["mrd_indexed"].runner_path == module / "scripts" / "run_mrd_indexed.py"
+    assert index.modules["mrd_indexed"].outputs_dir == module / "outputs"
+
+
+def test_extract_verdict_accepts_nan_reports(tmp_path: Path) -> None:
+    report = tmp_path / "x.report.json"
+    report.write_text('{"value": NaN, "verdict": "NO-EVAL(B3)"}', encoding="utf-8")
+    assert extract_verdict_from_report(report) == "NO-EVAL(B3)"
+    report.write_text("{not json", encoding="utf-8")
+    assert extract_verdict_from_report(report) is None
+
+
+def test_run_bundle_strict_copies_are_independent(tmp_path: Path) -> None:
+    suite = tmp_path / SUITE_EXTENSIONS
+    module = suite / "mrd_copy"
+    _write_runner(
+        module / "scripts" / "run_mrd_copy.py",
+        """
+        from pathlib import Path
+
+        Path("outputs", "copy.report.json").write_text('{"verdict": "PASS"}', encoding="utf-8")
+        Path("outputs", "extra.txt").write_text("artifact", encoding="utf-8")
+        """,
+    )
+    bundle = module / "inputs" / "pass.yaml"
+    _write_bundle(bundle)
+
+    out = tmp_path / "out"
+    res = run_bundle(bundle, module="mrd_copy", out_dir=out, strict=True)
+    assert res.report_path == out / "report.json"
+    assert (out / "module_outputs" / "extra.txt").read_text(encoding="utf-8") == "artifact"
+
+    (module / "outputs" / "extra.txt").write_text("rewritten", encoding="utf-8")
+    (module / "outputs" / "copy.report.json").write_text("{}", encoding="utf-8")
+    assert (out / "module_outputs" / "extra.txt").read_text(encoding="utf-8") == "artifact"
+    assert extract_verdict_from_report(out / "report.json") == "PASS"
+
+
+def test_extract_verdict_rejects_truncated_reports(tmp_path: Path) -> None:
+    report = tmp_path / "big.report.json"
+    full = json.dumps({"verdict": "PASS", "rows": list(range(1000))})
+    report.write_text(full[: len(full) // 2], encoding="utf-8")
+    assert extract_verdict_from_report(report) is None
+    report.write_text(json.dumps({"summary": {"verdict": "FAIL(A1)"}}), encoding="utf-8")
+    assert extract_verdict_from_report(report) == "FAIL(A1)"
+
+
+def test_infer_module_from_yaml_path(tmp_path: Path) -> None:
+    nested = tmp_path / "mrd_outer" / "inputs" / "mrd_inner" / "pass.yaml"
+    assert infer_module_from_yaml_path(nested) == "mrd_inner"
+    dotted = tmp_path / "mrd_outer" / "mrd_gone" / ".." / "inputs" / "pass.yaml"
+    assert infer_module_from_yaml_path(dotted) == "mrd_outer"
+    assert infer_module_from_yaml_path(tmp_path / "plain" / "pass.yaml") is None
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from occ import science_research
+
+
+def _claim() -> Dict[str, Any]:
+    return {
+        "title": "Operational test claim",
+        "domain": {"omega_I": "lab", "observables": ["O1"]},
+        "parameters": [{"name": "theta"}],
+    }
+
+
+def test_research_claim_isolates_source_errors(monkeypatch) -> None:
+    def fake_arxiv(query: str, max_results: int = 5, timeout_s: int = 15) -> List[Dict[str, Any]]:
+        return [{"source": "arxiv", "title": query, "max": max_results}]
+
+    def broken_crossref(query: str, max_results: int = 5, timeout_s: int = 15) -> List[Any]:
+        raise OSError("offline")
+
+    monkeypatch.setattr(science_research, "search_arxiv", fake_arxiv)
+    monkeypatch.setattr(science_research, "search_crossref", broken_crossref)
+
+    out = science_research.research_claim(_claim(), max_results=3)
+    assert out["query"] == science_research.build_query_from_claim(_claim())
+    assert out["sources"]["arxiv"] == [{"source": "arxiv", "title": out["query"], "max": 3}]
+    assert out["sources"]["crossref"] == []
+    assert out["errors"] == ["crossref: offline"]
+
+
+def test_build_query_dedups_case_insensitively_and_caps_keywords() -> None:
+    claim = {
+        "title": "Alpha alpha BETA beta",
+        "domain": {"observables": [f"obs{i:02d}" for i in range(20)]},
+    }
+    words = science_research.build_query_from_claim(claim).split()
+    assert words[:2] == ["Alpha", "BETA"]
+    assert len(words) == 12
+    assert science_research.build_query_from_claim({}) == (
+        "operational consistency falsifiable prediction"
+    )
+
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>ArXiv Query</title>
+  <id>http://arxiv.org/api/feed</id>
+  <entry>
+    <id>http://arxiv.org/abs/0001</id>
+    <published>2024-01-02T00:00:00Z</published>
+    <title>First
+      result</title>
+    <summary>  Operational
+      consistency.  </summary>
+    <author><name>A. Author</name></author>
+    <author><name> B. Author </name></author>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/0002</id>
+    <title>Second</title>
+  </entry>
+</feed>
+"""
+
+
+def test_parse_arxiv_feed_entries() -> None:
+    rows = science_research._parse_arxiv_feed(FEED)
+    assert [r["url"] for r in rows] == ["http://arxiv.org/abs/0001", "http://arxiv.org/abs/0002"]
+    assert rows[0]["title"] == "First result"
+    assert rows[0]["summary"] == "Operational consistency."
+    assert rows[0]["authors"] == ["A. Author", "B. Author"]
+    assert rows[0]["published"] == "2024-01-02T00:00:00Z"
+    assert rows[1]["authors"] == [] and rows[1]["summary"] == ""
+
+
+def test_parse_arxiv_feed_tolerates_invalid_utf8() -> None:
+    rows = science_research._parse_arxiv_feed(FEED.replace(b"Second", b"Sec\xffond"))
+    assert [r["title"] for r in rows] == ["First result", "Sec\ufffdond"]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from occ.util import simple_yaml
+
+REPO = Path(__file__).resolve().parents[1]
+
+SAMPLE = """\
+# leading comment
+claim_id: CLAIM-001  # trailing comment
+title: "Quoted # not a comment"
+note: 'single # quoted'
+enabled: true
+ratio: 0.5
+domain:
+  omega_I: test-domain
+  observables:
+    - O1
+    - "O2"
+parameters:
+  - name: theta
+    accessible: false
+  - name: phi
+summary: >-
+  folded
+  text
+"""
+
+
+def test_safe_load_bundle_subset() -> None:
+    assert simple_yaml.safe_load(SAMPLE) == {
+        "claim_id": "CLAIM-001",
+        "title": "Quoted # not a comment",
+        "note": "single # quoted",
+        "enabled": True,
+        "ratio": 0.5,
+        "domain": {"omega_I": "test-domain", "observables": ["O1", "O2"]},
+        "parameters": [{"name": "theta", "accessible": False}, {"name": "phi"}],
+        "summary": "folded text",
+    }
+
+
+def test_safe_load_crlf_and_blank_lines() -> None:
+    text = SAMPLE.replace("\n", "\r\n").replace("enabled", "\r\n   \r\nenabled")
+    assert simple_yaml.safe_load(text) == simple_yaml.safe_load(SAMPLE)
+
+
+def test_safe_load_empty() -> None:
+    assert simple_yaml.safe_load("# only a comment\n\n") is None
+
+
+def test_strip_comment_quote_handling() -> None:
+    strip = simple_yaml._strip_comment
+    assert strip("a: b  # c") == "a: b"
+    assert strip("a: \"x # y\" # z") == 'a: "x # y"'
+    assert strip("a: 'it''s' # z") == "a: 'it''s'"
+    assert strip("a: \"open # never closed") == 'a: "open # never closed'
+    assert strip("# whole line") == ""
+
+
+@pytest.mark.parametrize(
+    "path",
+    sorted((REPO / "examples" / "claim_specs").glob("*.yaml"))
+    + sorted((REPO / "predictions").glob("*.yaml")),
+    ids=lambda p: p.name,
+)
+def test_safe_load_matches_pyyaml_on_repo_bundles(path: Path) -> None:
+    yaml = pytest.importorskip("yaml")
+    text = path.read_text(encoding="utf-8")
+    assert simple_yaml.safe_load(text) == yaml.safe_load(text)
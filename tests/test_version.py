@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import pytest
+
 from occ import version as version_mod
 
 
+@pytest.fixture(autouse=True)
+def _fresh_version_cache():
+    version_mod.invalidate_version_cache()
+    yield
+    version_mod.invalidate_version_cache()
+
+
 def test_get_version_prefers_env_override(monkeypatch) -> None:
     monkeypatch.setenv("OCC_APP_VERSION", "9.9.9")
     monkeypatch.setattr(version_mod, "_read_pyproject_version", lambda: "1.2.3")
@@ -31,3 +40,48 @@ def test_read_pyproject_version_from_meipass(tmp_path, monkeypatch) -> None:
     )
     monkeypatch.setattr(version_mod.sys, "_MEIPASS", str(tmp_path), raising=False)
     assert version_mod._read_pyproject_version() == "7.7.7"
+
+
+def test_read_pyproject_version_uses_project_table(tmp_path, monkeypatch) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        "\n".join(
+            [
+                "[tool.other]",
+                'version = "0.0.9"',
+                "",
+                "[project]",
+                'name = "occ-mrd-runner"',
+                'version = "8.1.0"',
+            ]
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(version_mod.sys, "_MEIPASS", str(tmp_path), raising=False)
+    assert version_mod._read_pyproject_version() == "8.1.0"
+
+
+def test_get_version_is_resolved_once(monkeypatch) -> None:
+    monkeypatch.delenv("OCC_APP_VERSION", raising=False)
+    calls = []
+
+    def fake_read() -> str:
+        calls.append(1)
+        return "1.2.3"
+
+    monkeypatch.setattr(version_mod, "_read_pyproject_version", fake_read)
+    assert version_mod.get_version() == version_mod.get_version() == "1.2.3"
+    assert len(calls) == 1
+
+
+def test_invalidate_version_cache_picks_up_pyproject_edits(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("OCC_APP_VERSION", raising=False)
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nversion = "1.0.0"\n', encoding="utf-8")
+    monkeypatch.setattr(version_mod.sys, "_MEIPASS", str(tmp_path), raising=False)
+    assert version_mod.get_version() == "1.0.0"
+
+    pyproject.write_text('[project]\nversion = "1.0.1"\n', encoding="utf-8")
+    assert version_mod.get_version() == "1.0.0"
+    version_mod.invalidate_version_cache()
+    assert version_mod.get_version() == "1.0.1"